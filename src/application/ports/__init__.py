@@ -7,6 +7,7 @@ These are interfaces that will be implemented by infrastructure adapters.
 from .report_generator import ReportGenerator
 from .cache_service import CacheService
 from .notification_service import NotificationService
+from .report_status_store import ReportStatusStore
 from .time_tracking_api import TimeTrackingAPI
 from .work_item_api import WorkItemAPI
 
@@ -14,6 +15,7 @@ __all__ = [
     "ReportGenerator",
     "CacheService",
     "NotificationService",
+    "ReportStatusStore",
     "TimeTrackingAPI",
     "WorkItemAPI",
 ]
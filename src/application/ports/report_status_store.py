@@ -0,0 +1,52 @@
+"""Report status store port."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class ReportStatusStore(ABC):
+    """Port for tracking the status of report generation jobs.
+
+    This interface abstracts where job status lives so that status
+    endpoints, background tasks and WebSocket updates can share it,
+    even across multiple worker processes.
+    """
+
+    @abstractmethod
+    async def get(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Get the status of a report.
+
+        Args:
+            report_id: Report ID
+
+        Returns:
+            Status fields, or None if the report is unknown
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, report_id: str, **fields: Any) -> None:
+        """Create or update status fields for a report.
+
+        Args:
+            report_id: Report ID
+            **fields: Status fields to set (status, progress, message, ...)
+        """
+        pass
+
+    @abstractmethod
+    async def try_acquire_poll(self, report_id: str, interval: float) -> bool:
+        """Rate-limit status polling for a report.
+
+        Args:
+            report_id: Report ID
+            interval: Minimum seconds between polls
+
+        Returns:
+            True if a poll is allowed now, False if the last one was too recent
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release any resources held by the store."""
+        pass
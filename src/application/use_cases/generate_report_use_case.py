@@ -33,6 +33,8 @@ class GenerateReportRequest:
     project_ids: Optional[List[str]] = None
     include_unmatched: bool = True
     group_by: Optional[List[str]] = None
+    # False forces a refresh from the APIs; fresh results are still cached
+    use_cache: bool = True
 
     def validate(self) -> None:
         """Validate the request."""
@@ -110,36 +112,59 @@ class GenerateReportUseCase:
             # Validate request
             request.validate()
 
-            # Step 1: Fetch time entries
-            time_entries = await self._fetch_time_entries(request)
-
-            if not time_entries:
-                warnings.append("No time entries found for the specified criteria")
-                return GenerateReportResponse(
-                    success=True,
-                    report_path=None,
-                    total_entries=0,
-                    matched_entries=0,
-                    unmatched_entries=0,
-                    total_hours=0.0,
-                    errors=errors,
-                    warnings=warnings,
-                    metadata={},
+            # Fetching and matching depend only on the date range and
+            # filters, so a cached result lets a report be re-rendered
+            # (e.g. in another format) without calling the APIs again
+            prepared = await self._get_cached_report_data(request)
+
+            if prepared is None:
+                # Step 1: Fetch time entries
+                time_entries = await self._fetch_time_entries(request)
+
+                if not time_entries:
+                    warnings.append("No time entries found for the specified criteria")
+                    return GenerateReportResponse(
+                        success=True,
+                        report_path=None,
+                        total_entries=0,
+                        matched_entries=0,
+                        unmatched_entries=0,
+                        total_hours=0.0,
+                        errors=errors,
+                        warnings=warnings,
+                        metadata={},
+                    )
+
+                # Step 2: Extract work item IDs
+                work_item_ids = self._extract_work_item_ids(time_entries)
+
+                # Step 3: Fetch work items
+                work_items = await self._fetch_work_items(
+                    work_item_ids, request.use_cache
                 )
 
-            # Step 2: Extract work item IDs
-            work_item_ids = self._extract_work_item_ids(time_entries)
+                # Step 4: Match entries to work items
+                matching_results = (
+                    self.matching_service.match_time_entries_to_work_items(
+                        time_entries, {int(wi.id): wi for wi in work_items}
+                    )
+                )
 
-            # Step 3: Fetch work items
-            work_items = await self._fetch_work_items(work_item_ids)
+                # Step 5: Calculate statistics
+                prepared = {
+                    "report_data": self._prepare_report_data(
+                        matching_results, request.include_unmatched
+                    ),
+                    "stats": self.matching_service.get_match_statistics(
+                        matching_results
+                    ),
+                    "total_entries": len(time_entries),
+                    "total_hours": sum(entry.duration.hours for entry in time_entries),
+                }
 
-            # Step 4: Match entries to work items
-            matching_results = self.matching_service.match_time_entries_to_work_items(
-                time_entries, {int(wi.id): wi for wi in work_items}
-            )
+                await self._cache_report_data(request, prepared)
 
-            # Step 5: Calculate statistics
-            stats = self.matching_service.get_match_statistics(matching_results)
+            stats = prepared["stats"]
 
             # Add warnings for low match rate
             if stats["match_rate"] < 0.5:
@@ -148,9 +173,7 @@ class GenerateReportUseCase:
                 )
 
             # Step 6: Generate report
-            report_data = self._prepare_report_data(
-                matching_results, request.include_unmatched
-            )
+            report_data = prepared["report_data"]
 
             report_path = await self.report_generator.generate(
                 data=report_data,
@@ -167,16 +190,13 @@ class GenerateReportUseCase:
             if self.notification_service:
                 await self._send_notifications(report_path, stats)
 
-            # Calculate total hours
-            total_hours = sum(entry.duration.hours for entry in time_entries)
-
             return GenerateReportResponse(
                 success=True,
                 report_path=report_path,
-                total_entries=len(time_entries),
+                total_entries=prepared["total_entries"],
                 matched_entries=stats["matched_entries"],
                 unmatched_entries=stats["unmatched_entries"],
-                total_hours=total_hours,
+                total_hours=prepared["total_hours"],
                 errors=errors,
                 warnings=warnings,
                 metadata={
@@ -201,6 +221,64 @@ class GenerateReportUseCase:
                 metadata={},
             )
 
+    def _filters_cache_key(self, request: GenerateReportRequest) -> str:
+        """Build the cache key part for a request's date range and filters.
+
+        Args:
+            request: The report generation request
+
+        Returns:
+            Cache key part
+        """
+        start, end = request.date_range.format_for_api()
+        user_ids = sorted(request.user_ids or [])
+        project_ids = sorted(request.project_ids or [])
+        return f"{start}_{end}_{user_ids}_{project_ids}"
+
+    def _report_data_cache_key(self, request: GenerateReportRequest) -> str:
+        """Build the cache key for a request's matched report data.
+
+        Args:
+            request: The report generation request
+
+        Returns:
+            Cache key
+        """
+        return (
+            f"report_data_{self._filters_cache_key(request)}"
+            f"_{request.include_unmatched}"
+        )
+
+    async def _get_cached_report_data(
+        self, request: GenerateReportRequest
+    ) -> Optional[Dict[str, Any]]:
+        """Get previously matched report data for a request.
+
+        Args:
+            request: The report generation request
+
+        Returns:
+            Report data, statistics and totals, or None if not cached
+        """
+        if not self.cache_service or not request.use_cache:
+            return None
+
+        return await self.cache_service.get(self._report_data_cache_key(request))
+
+    async def _cache_report_data(
+        self, request: GenerateReportRequest, prepared: Dict[str, Any]
+    ) -> None:
+        """Cache matched report data for a request.
+
+        Args:
+            request: The report generation request
+            prepared: Report data, statistics and totals
+        """
+        if self.cache_service:
+            await self.cache_service.set(
+                self._report_data_cache_key(request), prepared, ttl=3600
+            )
+
     async def _fetch_time_entries(
         self, request: GenerateReportRequest
     ) -> List[TimeEntry]:
@@ -213,9 +291,9 @@ class GenerateReportUseCase:
             List of time entries
         """
         # Check cache first if available
-        cache_key = f"time_entries_{request.date_range}_{request.user_ids}_{request.project_ids}"
+        cache_key = f"time_entries_{self._filters_cache_key(request)}"
 
-        if self.cache_service:
+        if self.cache_service and request.use_cache:
             cached = await self.cache_service.get(cache_key)
             if cached:
                 return cached
@@ -265,11 +343,14 @@ class GenerateReportUseCase:
 
         return all_ids
 
-    async def _fetch_work_items(self, work_item_ids: set[int]) -> List[WorkItem]:
+    async def _fetch_work_items(
+        self, work_item_ids: set[int], use_cache: bool = True
+    ) -> List[WorkItem]:
         """Fetch work items by IDs.
 
         Args:
             work_item_ids: Set of work item IDs
+            use_cache: Whether cached work items may be reused
 
         Returns:
             List of work items
@@ -280,7 +361,7 @@ class GenerateReportUseCase:
         # Check cache first
         cache_key = f"work_items_{sorted(work_item_ids)}"
 
-        if self.cache_service:
+        if self.cache_service and use_cache:
             cached = await self.cache_service.get(cache_key)
             if cached:
                 return cached
@@ -1,24 +1,71 @@
 """Duration value object."""
 
+import re
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
 
+# Simple ISO 8601 duration parser for common formats
+_ISO8601_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?")
 
-@dataclass(frozen=True)
+# format_human_readable templates by (has hours, has minutes)
+_HUMAN_READABLE_FORMATS = {
+    (True, True): "{hours}h {minutes}m",
+    (True, False): "{hours}h",
+    (False, True): "{minutes}m",
+    (False, False): "0m",
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso8601_seconds(iso_duration: str) -> float:
+    """Parse an ISO 8601 duration string into seconds.
+
+    Time entries repeat a small set of durations (PT1H, PT30M, ...), so
+    results are cached. Invalid strings raise every time; errors are not
+    cached.
+
+    Args:
+        iso_duration: ISO 8601 duration string
+
+    Returns:
+        Total seconds
+
+    Raises:
+        ValueError: If the string is not a supported ISO 8601 duration
+    """
+    match = _ISO8601_DURATION_RE.match(iso_duration)
+
+    if not match:
+        raise ValueError(f"Invalid ISO 8601 duration: {iso_duration}")
+
+    hours = int(match.group(1) or 0)
+    minutes = int(match.group(2) or 0)
+    seconds = float(match.group(3) or 0)
+
+    return hours * 3600 + minutes * 60 + seconds
+
+
+@dataclass(frozen=True, slots=True)
 class Duration:
     """Represents a time duration in a domain-friendly way.
 
-    Internally stores duration as seconds but provides convenient
+    Internally stores duration as whole seconds but provides convenient
     methods for working with hours, minutes, and timedelta objects.
+    One is created per time entry, so instances use slots.
     """
 
-    _seconds: float
+    _seconds: int
 
     def __post_init__(self) -> None:
         """Validate duration after initialization."""
         if self._seconds < 0:
             raise ValueError(f"Duration cannot be negative: {self._seconds} seconds")
 
+        # Time tracking has no use for sub-second precision
+        if not isinstance(self._seconds, int):
+            object.__setattr__(self, "_seconds", round(self._seconds))
+
     @classmethod
     def from_seconds(cls, seconds: float) -> "Duration":
         """Create duration from seconds."""
@@ -49,24 +96,10 @@ class Duration:
         Returns:
             Duration instance
         """
-        import re
-
-        # Simple ISO 8601 duration parser for common formats
-        pattern = r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?"
-        match = re.match(pattern, iso_duration)
-
-        if not match:
-            raise ValueError(f"Invalid ISO 8601 duration: {iso_duration}")
-
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2) or 0)
-        seconds = float(match.group(3) or 0)
-
-        total_seconds = hours * 3600 + minutes * 60 + seconds
-        return cls(total_seconds)
+        return cls(_parse_iso8601_seconds(iso_duration))
 
     @property
-    def seconds(self) -> float:
+    def seconds(self) -> int:
         """Get duration in seconds."""
         return self._seconds
 
@@ -86,16 +119,10 @@ class Duration:
 
     def format_human_readable(self) -> str:
         """Format duration in human-readable format (e.g., '2h 30m')."""
-        hours = int(self._seconds // 3600)
-        minutes = int((self._seconds % 3600) // 60)
-
-        parts = []
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0 or hours == 0:
-            parts.append(f"{minutes}m")
-
-        return " ".join(parts) if parts else "0m"
+        hours, minutes = divmod(self._seconds // 60, 60)
+        return _HUMAN_READABLE_FORMATS[hours > 0, minutes > 0].format(
+            hours=hours, minutes=minutes
+        )
 
     def __add__(self, other: "Duration") -> "Duration":
         """Add two durations."""
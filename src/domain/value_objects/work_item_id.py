@@ -1,7 +1,13 @@
 """Work Item ID value object."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
+from weakref import WeakValueDictionary
+
+# Live instances by (class, value type, value). The type keeps 5.0, which
+# hashes like 5, from re-initializing the shared WorkItemId(5)
+_instances: "WeakValueDictionary[tuple, WorkItemId]" = WeakValueDictionary()
 
 
 @dataclass(frozen=True)
@@ -14,6 +20,24 @@ class WorkItemId:
 
     value: int
 
+    def __new__(cls, value=None):
+        """Return the existing instance for this ID, if there is one.
+
+        The same work items are referenced by many time entries, so equal
+        IDs share one instance. ``value`` is optional because pickle and
+        copy create instances without arguments.
+        """
+        try:
+            existing = _instances.get((cls, type(value), value))
+        except TypeError:
+            # Unhashable value; __post_init__ rejects it
+            existing = None
+
+        if existing is not None:
+            return existing
+
+        return super().__new__(cls)
+
     def __post_init__(self) -> None:
         """Validate the work item ID after initialization."""
         if not isinstance(self.value, int):
@@ -25,6 +49,9 @@ class WorkItemId:
         if self.value > 999999:
             raise ValueError(f"Work item ID seems invalid (too large): {self.value}")
 
+        # Only valid IDs are shared
+        _instances.setdefault((type(self), type(self.value), self.value), self)
+
     def __str__(self) -> str:
         """String representation of the work item ID."""
         return str(self.value)
@@ -44,8 +71,9 @@ class WorkItemId:
             WorkItemId instance or None if invalid
         """
         try:
-            return cls(int(value))
-        except (ValueError, TypeError):
+            return _from_string_cached(cls, value)
+        except TypeError:
+            # Unhashable input cannot be a work item ID
             return None
 
     def format_for_ado(self) -> str:
@@ -55,3 +83,23 @@ class WorkItemId:
     def format_for_display(self) -> str:
         """Format the ID for user display."""
         return f"#{self.value}"
+
+
+@lru_cache(maxsize=2048)
+def _from_string_cached(cls: type, value: str) -> Optional[WorkItemId]:
+    """Parse a work item ID string, caching results (including None).
+
+    Descriptions reference the same few work items over and over, and
+    WorkItemId is immutable, so instances can be shared.
+
+    Args:
+        cls: WorkItemId class to instantiate
+        value: String that might contain a work item ID
+
+    Returns:
+        WorkItemId instance or None if invalid
+    """
+    try:
+        return cls(int(value))
+    except (ValueError, TypeError):
+        return None
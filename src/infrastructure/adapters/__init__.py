@@ -1,11 +1,28 @@
 """Infrastructure adapters for ports."""
 
 from .cache_adapters import LocalCacheService, RedisCacheService
-from .report_generators import ExcelReportGenerator, HTMLReportGenerator
+from .report_status_stores import (
+    InMemoryReportStatusStore,
+    RedisReportStatusStore,
+    create_report_status_store,
+)
 
 __all__ = [
     "LocalCacheService",
     "RedisCacheService",
     "ExcelReportGenerator",
     "HTMLReportGenerator",
+    "InMemoryReportStatusStore",
+    "RedisReportStatusStore",
+    "create_report_status_store",
 ]
+
+
+def __getattr__(name):
+    """Import the report generators (polars, openpyxl, jinja2) on first use."""
+    if name in ("ExcelReportGenerator", "HTMLReportGenerator"):
+        from . import report_generators
+
+        return getattr(report_generators, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,13 @@
-"""Report generator implementations."""
+"""Report generator implementations.
 
+Rendering is CPU-bound, so the generators build and write their files on a
+dedicated thread pool to keep the event loop responsive. The pool is separate
+from the loop's default executor, which also serves DNS lookups.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
@@ -11,10 +19,20 @@ from openpyxl.styles import Font, PatternFill
 from jinja2 import Template
 
 from ...application.ports import ReportGenerator
+from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _render_executor() -> ThreadPoolExecutor:
+    """Get the thread pool reports are rendered on, sized by REPORT_RENDER_WORKERS."""
+    return ThreadPoolExecutor(
+        max_workers=get_settings().report_render_workers,
+        thread_name_prefix="report-render",
+    )
+
+
 class ExcelReportGenerator(ReportGenerator):
     """Excel report generator implementation."""
 
@@ -45,6 +63,26 @@ class ExcelReportGenerator(ReportGenerator):
         if not output_path:
             output_path = Path(f"report_{datetime.now():%Y%m%d_%H%M%S}.xlsx")
 
+        await asyncio.get_running_loop().run_in_executor(
+            _render_executor(), self._write_workbook, data, output_path, options
+        )
+
+        logger.info(f"Excel report generated: {output_path}")
+        return output_path
+
+    def _write_workbook(
+        self,
+        data: Dict[str, Any],
+        output_path: Path,
+        options: Optional[Dict[str, Any]],
+    ):
+        """Build the workbook and save it to disk.
+
+        Args:
+            data: Report data
+            output_path: Output file path
+            options: Additional options
+        """
         # Create workbook
         wb = Workbook()
 
@@ -60,9 +98,6 @@ class ExcelReportGenerator(ReportGenerator):
         # Save workbook
         wb.save(output_path)
 
-        logger.info(f"Excel report generated: {output_path}")
-        return output_path
-
     def _create_summary_sheet(
         self, wb: Workbook, data: Dict[str, Any], options: Optional[Dict[str, Any]]
     ):
@@ -295,6 +330,26 @@ class HTMLReportGenerator(ReportGenerator):
         if not output_path:
             output_path = Path(f"report_{datetime.now():%Y%m%d_%H%M%S}.html")
 
+        await asyncio.get_running_loop().run_in_executor(
+            _render_executor(), self._write_html, data, output_path, options
+        )
+
+        logger.info(f"HTML report generated: {output_path}")
+        return output_path
+
+    def _write_html(
+        self,
+        data: Dict[str, Any],
+        output_path: Path,
+        options: Optional[Dict[str, Any]],
+    ):
+        """Render the HTML report and write it to disk.
+
+        Args:
+            data: Report data
+            output_path: Output file path
+            options: Additional options
+        """
         # Create HTML template
         template = Template(self._get_html_template())
 
@@ -307,9 +362,6 @@ class HTMLReportGenerator(ReportGenerator):
         # Save to file
         output_path.write_text(html_content)
 
-        logger.info(f"HTML report generated: {output_path}")
-        return output_path
-
     def _get_html_template(self) -> str:
         """Get HTML template."""
         return """<!DOCTYPE html>
@@ -0,0 +1,221 @@
+"""Report status store implementations."""
+
+from typing import Any, Dict, Optional, Tuple
+import logging
+import time
+
+from ...application.ports import ReportStatusStore
+from ..config.settings import CacheBackend, Settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds a report's status is kept after its last update
+REPORT_STATUS_TTL = 86400
+
+# Maximum number of reports tracked by the in-memory store
+MAX_TRACKED_REPORTS = 10_000
+
+
+class InMemoryReportStatusStore(ReportStatusStore):
+    """Process-local report status store.
+
+    Only suitable when the API runs as a single worker process. Like the
+    Redis store, a report is forgotten ``ttl`` seconds after its last
+    update; beyond ``max_reports`` the least recently updated is dropped.
+    """
+
+    def __init__(
+        self, ttl: int = REPORT_STATUS_TTL, max_reports: int = MAX_TRACKED_REPORTS
+    ):
+        """Initialize in-memory status store.
+
+        Args:
+            ttl: Seconds to keep a report's status after its last update
+            max_reports: Maximum number of reports to keep
+        """
+        self.ttl = ttl
+        self.max_reports = max_reports
+
+        # report_id -> (expires_at, status), least recently updated first
+        self._reports: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # report_id -> monotonic time the next status poll is allowed
+        self._next_poll: Dict[str, float] = {}
+
+    def _forget(self, report_id: str) -> None:
+        """Drop everything tracked for a report.
+
+        Args:
+            report_id: Report ID
+        """
+        del self._reports[report_id]
+        self._next_poll.pop(report_id, None)
+
+    async def get(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Get the status of a report.
+
+        Args:
+            report_id: Report ID
+
+        Returns:
+            Status fields, or None if the report is unknown
+        """
+        entry = self._reports.get(report_id)
+        if entry is None:
+            return None
+
+        expires_at, status = entry
+        if expires_at <= time.monotonic():
+            self._forget(report_id)
+            return None
+
+        return dict(status)
+
+    async def update(self, report_id: str, **fields: Any) -> None:
+        """Create or update status fields for a report.
+
+        Args:
+            report_id: Report ID
+            **fields: Status fields to set
+        """
+        entry = self._reports.pop(report_id, None)
+        status = entry[1] if entry else {}
+        status.update(fields)
+
+        self._reports[report_id] = (time.monotonic() + self.ttl, status)
+
+        # Dicts keep insertion order, so the first key is the stalest
+        while len(self._reports) > self.max_reports:
+            self._forget(next(iter(self._reports)))
+
+    async def try_acquire_poll(self, report_id: str, interval: float) -> bool:
+        """Rate-limit status polling for a report.
+
+        Args:
+            report_id: Report ID
+            interval: Minimum seconds between polls
+
+        Returns:
+            True if a poll is allowed now, False if the last one was too recent
+        """
+        if report_id not in self._reports:
+            return True
+
+        now = time.monotonic()
+        if self._next_poll.get(report_id, 0.0) > now:
+            return False
+
+        self._next_poll[report_id] = now + interval
+        return True
+
+
+class RedisReportStatusStore(ReportStatusStore):
+    """Redis-backed report status store shared by all worker processes.
+
+    Each report is a hash at ``{key_prefix}report:{report_id}`` that
+    expires ``ttl`` seconds after its last update.
+    """
+
+    def __init__(
+        self, redis_url: str, key_prefix: str = "", ttl: int = REPORT_STATUS_TTL
+    ):
+        """Initialize Redis status store.
+
+        Args:
+            redis_url: Redis connection URL
+            key_prefix: Prefix for all keys
+            ttl: Seconds to keep a report's status after its last update
+        """
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(redis_url, decode_responses=True)
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+
+    def _make_key(self, report_id: str) -> str:
+        """Create the hash key for a report.
+
+        Args:
+            report_id: Report ID
+
+        Returns:
+            Full key with prefix
+        """
+        return f"{self.key_prefix}report:{report_id}"
+
+    async def get(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Get the status of a report.
+
+        Args:
+            report_id: Report ID
+
+        Returns:
+            Status fields, or None if the report is unknown
+        """
+        status = await self.redis.hgetall(self._make_key(report_id))
+        if not status:
+            return None
+
+        # Hash values come back as strings
+        if "progress" in status:
+            status["progress"] = float(status["progress"])
+
+        return status
+
+    async def update(self, report_id: str, **fields: Any) -> None:
+        """Create or update status fields for a report.
+
+        Args:
+            report_id: Report ID
+            **fields: Status fields to set
+        """
+        key = self._make_key(report_id)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={name: str(value) for name, value in fields.items()})
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def try_acquire_poll(self, report_id: str, interval: float) -> bool:
+        """Rate-limit status polling for a report.
+
+        The first poll in each interval creates a short-lived marker key;
+        polls that find it still present are refused.
+
+        Args:
+            report_id: Report ID
+            interval: Minimum seconds between polls
+
+        Returns:
+            True if a poll is allowed now, False if the last one was too recent
+        """
+        acquired = await self.redis.set(
+            f"{self.key_prefix}report-poll:{report_id}",
+            1,
+            nx=True,
+            px=max(1, int(interval * 1000)),
+        )
+        return bool(acquired)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self.redis.close()
+
+
+def create_report_status_store(settings: Settings) -> ReportStatusStore:
+    """Create the report status store configured by the settings.
+
+    Redis is used when it is the configured cache backend; otherwise status
+    is kept in process memory.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Report status store
+    """
+    if settings.cache_backend == CacheBackend.REDIS and settings.redis_host:
+        return RedisReportStatusStore(settings.redis_url, settings.redis_key_prefix)
+
+    logger.info("Using in-memory report status store; run a single worker")
+    return InMemoryReportStatusStore()
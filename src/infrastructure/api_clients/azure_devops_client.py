@@ -1,10 +1,13 @@
 """Azure DevOps API client implementation."""
 
+import asyncio
 import base64
-from typing import List, Optional, Dict, Any, Set
+from typing import AsyncIterator, Iterable, List, Optional, Dict, Any, Set
 from datetime import datetime
 import logging
 
+import httpx
+
 from .base_client import BaseAPIClient, NotFoundError
 from ...domain.entities import WorkItem
 from ...domain.value_objects import WorkItemId
@@ -12,6 +15,9 @@ from ...infrastructure.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Number of work item batches fetched at once
+BATCH_CONCURRENCY = 5
+
 
 class AzureDevOpsClient(BaseAPIClient):
     """Azure DevOps API client implementation.
@@ -20,11 +26,12 @@ class AzureDevOpsClient(BaseAPIClient):
     including fetching work items, iterations, and running queries.
     """
 
-    def __init__(self, settings=None):
+    def __init__(self, settings=None, http_client: Optional[httpx.AsyncClient] = None):
         """Initialize Azure DevOps client.
 
         Args:
             settings: Optional settings override
+            http_client: Optional HTTP client shared with other API clients
         """
         settings = settings or get_settings()
 
@@ -43,6 +50,7 @@ class AzureDevOpsClient(BaseAPIClient):
             headers=headers,
             timeout=settings.ado_timeout,
             max_retries=settings.ado_max_retries,
+            http_client=http_client,
         )
 
         self.organization = settings.ado_organization
@@ -116,44 +124,100 @@ class AzureDevOpsClient(BaseAPIClient):
         Returns:
             List of WorkItem entities
         """
-        if not work_item_ids:
-            return []
+        ids_list = list(work_item_ids)
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
 
-        work_items = []
+        async def fetch(batch_ids: List[int]) -> Optional[List[WorkItem]]:
+            async with semaphore:
+                return await self._fetch_work_items_chunk(batch_ids, fields, expand)
+
+        # Process in batches (ADO limit is 200); gather keeps batch order
+        batches = await asyncio.gather(
+            *(
+                fetch(ids_list[i : i + self.batch_size])
+                for i in range(0, len(ids_list), self.batch_size)
+            )
+        )
+
+        return [
+            work_item for batch in batches if batch is not None for work_item in batch
+        ]
+
+    async def iter_work_items_batch(
+        self,
+        work_item_ids: Iterable[int],
+        fields: Optional[List[str]] = None,
+        expand: str = "None",
+    ) -> AsyncIterator[List[WorkItem]]:
+        """Fetch work items in batches, yielding each batch as it arrives.
+
+        Args:
+            work_item_ids: Work item IDs, fetched in the given order
+            fields: Optional list of fields to return
+            expand: Expand parameter
+
+        Yields:
+            Lists of up to batch_size WorkItem entities
+        """
         ids_list = list(work_item_ids)
 
         # Process in batches (ADO limit is 200)
         for i in range(0, len(ids_list), self.batch_size):
-            batch_ids = ids_list[i : i + self.batch_size]
+            work_items = await self._fetch_work_items_chunk(
+                ids_list[i : i + self.batch_size], fields, expand
+            )
 
-            # Convert to comma-separated string
-            ids_str = ",".join(map(str, batch_ids))
+            if work_items is not None:
+                yield work_items
 
-            endpoint = f"/{self.project}/_apis/wit/workitems"
+    async def _fetch_work_items_chunk(
+        self,
+        batch_ids: List[int],
+        fields: Optional[List[str]],
+        expand: str,
+    ) -> Optional[List[WorkItem]]:
+        """Fetch one batch of work items.
 
-            params = {
-                "ids": ids_str,
-                "api-version": self.api_version,
-                "$expand": expand,
-            }
+        Args:
+            batch_ids: Up to batch_size work item IDs
+            fields: Optional list of fields to return
+            expand: Expand parameter
 
-            if fields:
-                params["fields"] = ",".join(fields)
+        Returns:
+            WorkItem entities, or None if the request failed
+        """
+        # The batch endpoint takes IDs and fields in the request body, so a
+        # full batch never runs into URL length limits
+        endpoint = f"/{self.project}/_apis/wit/workitemsbatch"
+
+        # Omit missing/inaccessible IDs instead of failing the whole batch
+        body = {
+            "ids": batch_ids,
+            "$expand": expand,
+            "errorPolicy": "omit",
+        }
 
-            try:
-                response = await self.get(endpoint, params=params)
-                items = self._extract_items_from_response(response)
+        if fields:
+            body["fields"] = fields
 
-                for item_data in items:
-                    try:
-                        work_item = WorkItem.from_ado_data(item_data)
-                        work_items.append(work_item)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse work item: {e}")
-                        continue
+        try:
+            response = await self.post(
+                endpoint, json_data=body, params={"api-version": self.api_version}
+            )
+            items = self._extract_items_from_response(response)
+        except Exception as e:
+            logger.error(f"Failed to fetch batch of work items: {e}")
+            return None
 
+        work_items = []
+
+        for item_data in items:
+            if not item_data:
+                continue
+            try:
+                work_items.append(WorkItem.from_ado_data(item_data))
             except Exception as e:
-                logger.error(f"Failed to fetch batch of work items: {e}")
+                logger.warning(f"Failed to parse work item: {e}")
                 continue
 
         return work_items
@@ -203,6 +267,29 @@ class AzureDevOpsClient(BaseAPIClient):
 
         return []
 
+    async def iter_work_items_by_query(
+        self, wiql: str, fields: Optional[List[str]] = None
+    ) -> AsyncIterator[WorkItem]:
+        """Execute WIQL query and stream full work items page by page.
+
+        Only the matching IDs are held in memory; work items are fetched one
+        batch at a time and yielded in query order.
+
+        Args:
+            wiql: Work Item Query Language query
+            fields: Optional list of fields to return
+
+        Yields:
+            WorkItem entities
+        """
+        work_item_ids = await self.query_work_items(wiql)
+
+        async for batch in self.iter_work_items_batch(
+            dict.fromkeys(work_item_ids), fields=fields
+        ):
+            for work_item in batch:
+                yield work_item
+
     async def get_iterations(self, team: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get team iterations.
 
@@ -288,7 +375,7 @@ class AzureDevOpsClient(BaseAPIClient):
         wiql = f"""
         SELECT [System.Id], [System.Title], [System.State]
         FROM WorkItems
-        WHERE [System.TeamProject] = '{self.project}'
+        WHERE [System.TeamProject] = @Project
           AND [System.IterationPath] = '{iteration_path}'
         """
 
@@ -17,6 +17,14 @@ from tenacity import (
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package (installed via httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class APIError(Exception):
     """Base exception for API errors."""
@@ -68,6 +76,7 @@ class BaseAPIClient(ABC):
         timeout: int = 30,
         max_retries: int = 3,
         max_connections: int = 10,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize the base API client.
 
@@ -77,24 +86,36 @@ class BaseAPIClient(ABC):
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             max_connections: Maximum number of concurrent connections
+            http_client: Optional HTTP client shared with other API clients;
+                its owner is responsible for closing it
         """
         self.base_url = base_url.rstrip("/")
         self.headers = headers
         self.timeout = timeout
         self.max_retries = max_retries
 
-        # Configure connection pooling
-        limits = httpx.Limits(
-            max_keepalive_connections=max_connections, max_connections=max_connections
-        )
+        # Requests always send absolute URLs and their own headers and
+        # timeout, so a shared client works for any API
+        self._owns_client = http_client is None
+        if http_client is not None:
+            self.client = http_client
+        else:
+            # Configure connection pooling
+            limits = httpx.Limits(
+                max_keepalive_connections=max_connections,
+                max_connections=max_connections,
+            )
 
-        # Create async client with connection pooling
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers,
-            timeout=httpx.Timeout(timeout),
-            limits=limits,
-        )
+            # Create async client with connection pooling; with HTTP/2,
+            # concurrent requests are multiplexed over a single connection
+            # per host
+            self.client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=httpx.Timeout(timeout),
+                limits=limits,
+                http2=HTTP2_AVAILABLE,
+            )
 
         # Rate limiting
         self._rate_limiter = asyncio.Semaphore(10)  # 10 concurrent requests
@@ -110,8 +131,9 @@ class BaseAPIClient(ABC):
         await self.close()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client, unless it is shared."""
+        if self._owns_client:
+            await self.client.aclose()
 
     @retry(
         stop=stop_after_attempt(3),
@@ -169,6 +191,7 @@ class BaseAPIClient(ABC):
                     params=params,
                     json=json_data,
                     headers=request_headers,
+                    timeout=self.timeout,
                 )
 
                 self._last_request_time = asyncio.get_event_loop().time()
@@ -303,14 +326,20 @@ class BaseAPIClient(ABC):
         params: Optional[Dict[str, Any]] = None,
         page_size: int = 100,
         max_pages: Optional[int] = None,
+        concurrency: int = 1,
     ) -> List[Dict[str, Any]]:
         """Get paginated results.
 
+        With ``concurrency`` above 1, pages are requested that many at a
+        time. The total page count is not known up front, so up to
+        ``concurrency - 1`` requests past the last page may come back empty.
+
         Args:
             endpoint: API endpoint
             params: Initial query parameters
             page_size: Number of items per page
             max_pages: Maximum number of pages to fetch
+            concurrency: Number of pages to request at once
 
         Returns:
             List of all items from all pages
@@ -320,31 +349,38 @@ class BaseAPIClient(ABC):
         params = params or {}
 
         while True:
-            # Add pagination parameters
-            page_params = {**params, "page": page, "page-size": page_size}
+            last_page = page + concurrency - 1
+            if max_pages:
+                last_page = min(last_page, max_pages)
+
+            # Fetch the next window of pages (with pagination parameters)
+            responses = await asyncio.gather(
+                *(
+                    self.get(
+                        endpoint, params={**params, "page": p, "page-size": page_size}
+                    )
+                    for p in range(page, last_page + 1)
+                )
+            )
 
-            # Fetch page
-            response = await self.get(endpoint, params=page_params)
+            for response in responses:
+                # Extract items (implementation specific)
+                items = self._extract_items_from_response(response)
 
-            # Extract items (implementation specific)
-            items = self._extract_items_from_response(response)
+                if not items:
+                    return all_items
 
-            if not items:
-                break
+                all_items.extend(items)
 
-            all_items.extend(items)
+                # Check if there are more pages
+                if len(items) < page_size:
+                    return all_items
 
             # Check if we've reached the maximum pages
-            if max_pages and page >= max_pages:
-                break
-
-            # Check if there are more pages
-            if len(items) < page_size:
-                break
-
-            page += 1
+            if max_pages and last_page >= max_pages:
+                return all_items
 
-        return all_items
+            page = last_page + 1
 
     @abstractmethod
     def _extract_items_from_response(
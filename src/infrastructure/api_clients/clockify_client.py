@@ -4,6 +4,8 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 import logging
 
+import httpx
+
 from .base_client import BaseAPIClient
 from ...domain.entities import TimeEntry
 from ...domain.value_objects import DateRange
@@ -11,6 +13,9 @@ from ...infrastructure.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Number of time entry pages requested at once
+PAGE_CONCURRENCY = 5
+
 
 class ClockifyClient(BaseAPIClient):
     """Clockify API client implementation.
@@ -19,11 +24,12 @@ class ClockifyClient(BaseAPIClient):
     including fetching time entries, users, and projects.
     """
 
-    def __init__(self, settings=None):
+    def __init__(self, settings=None, http_client: Optional[httpx.AsyncClient] = None):
         """Initialize Clockify client.
 
         Args:
             settings: Optional settings override
+            http_client: Optional HTTP client shared with other API clients
         """
         settings = settings or get_settings()
 
@@ -37,6 +43,7 @@ class ClockifyClient(BaseAPIClient):
             headers=headers,
             timeout=settings.clockify_timeout,
             max_retries=settings.clockify_max_retries,
+            http_client=http_client,
         )
 
         self.workspace_id = settings.clockify_workspace_id
@@ -125,7 +132,9 @@ class ClockifyClient(BaseAPIClient):
             params["project"] = project_id
 
         # Use pagination to get all entries
-        all_entries = await self.get_paginated(endpoint, params=params, page_size=100)
+        all_entries = await self.get_paginated(
+            endpoint, params=params, page_size=100, concurrency=PAGE_CONCURRENCY
+        )
 
         # Convert to domain entities
         time_entries = []
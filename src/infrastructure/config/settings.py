@@ -98,6 +98,13 @@ class Settings(BaseSettings):
         Path("templates"), env="REPORT_TEMPLATE_DIR"
     )
     report_output_directory: Path = Field(Path("reports"), env="REPORT_OUTPUT_DIR")
+    report_render_workers: int = Field(4, env="REPORT_RENDER_WORKERS")
+
+    # API settings
+    cors_origins: List[str] = Field(
+        default_factory=lambda: ["http://localhost:3000"],  # Next.js default port
+        env="CORS_ORIGINS",
+    )
 
     # Performance settings
     max_concurrent_requests: int = Field(5, env="MAX_CONCURRENT_REQUESTS")
@@ -145,12 +152,12 @@ class Settings(BaseSettings):
                 v.mkdir(parents=True, exist_ok=True)
         return v
 
-    @field_validator("notification_recipients", mode="before")
+    @field_validator("notification_recipients", "cors_origins", mode="before")
     @classmethod
-    def parse_recipients(cls, v):
-        """Parse comma-separated recipients."""
+    def parse_comma_separated(cls, v):
+        """Parse comma-separated lists (recipients, CORS origins)."""
         if isinstance(v, str):
-            return [email.strip() for email in v.split(",") if email.strip()]
+            return [item.strip() for item in v.split(",") if item.strip()]
         return v
 
     @field_validator("debug", mode="after")
@@ -228,7 +235,7 @@ class Settings(BaseSettings):
         return getattr(self, attr_name, default)
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance.
 
@@ -1,7 +1,10 @@
 """Azure DevOps implementation of WorkItemRepository."""
 
-from typing import List, Optional, Set
+from typing import AsyncIterator, Dict, Hashable, List, Optional, Set, Tuple, TypeVar
+import asyncio
+import hashlib
 import logging
+import time
 
 from ...domain.repositories import WorkItemRepository
 from ...domain.entities import WorkItem
@@ -11,6 +14,112 @@ from ..api_clients import AzureDevOpsClient
 
 logger = logging.getLogger(__name__)
 
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+# Maximum number of concurrent create requests issued by save_batch
+SAVE_BATCH_CONCURRENCY = 10
+
+# Seconds a cached WIQL result or work item stays valid
+QUERY_CACHE_TTL = 60.0
+
+# Maximum number of WIQL results and work items kept in the caches
+MAX_CACHED_QUERIES = 256
+MAX_CACHED_ITEMS = 10_000
+
+# WIQL query templates; {value} is an escaped literal, {states} an optional
+# state filter clause
+_WIQL_BY_AREA = (
+    "SELECT [System.Id] FROM WorkItems"
+    " WHERE [System.TeamProject] = @Project"
+    " AND [System.AreaPath] UNDER {value}{states}"
+)
+_WIQL_BY_ASSIGNED_TO = (
+    "SELECT [System.Id] FROM WorkItems"
+    " WHERE [System.TeamProject] = @Project"
+    " AND [System.AssignedTo] = {value}{states}"
+    " ORDER BY [System.ChangedDate] DESC"
+)
+_WIQL_BY_TYPE = (
+    "SELECT [System.Id] FROM WorkItems"
+    " WHERE [System.TeamProject] = @Project"
+    " AND [System.WorkItemType] = {value}{states}"
+)
+_WIQL_BY_TITLE = (
+    "SELECT [System.Id] FROM WorkItems"
+    " WHERE [System.TeamProject] = @Project"
+    " AND [System.Title] CONTAINS {value}{states}"
+)
+_WIQL_CHILDREN = (
+    "SELECT [System.Id] FROM WorkItemLinks"
+    " WHERE [Source].[System.Id] = {parent_id}"
+    " AND [System.Links.LinkType] = 'System.LinkTypes.Hierarchy-Forward'"
+    " MODE (Recursive)"
+)
+
+
+def _wiql_literal(value: str) -> str:
+    """Quote a value as a WIQL string literal, escaping embedded quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _wiql_assignee(assigned_to: str) -> str:
+    """Render an assignee, using the @Me macro for the authenticated user."""
+    if assigned_to.strip().lower() == "@me":
+        return "@Me"
+    return _wiql_literal(assigned_to)
+
+
+def _wiql_state_clause(states: Optional[List[WorkItemState]]) -> str:
+    """Build the optional state filter with states in a stable order."""
+    if not states:
+        return ""
+    values = ", ".join(_wiql_literal(v) for v in sorted({s.value for s in states}))
+    return f" AND [System.State] IN ({values})"
+
+
+def _cache_get(cache: Dict[_K, Tuple[float, _V]], key: _K) -> Optional[_V]:
+    """Get a cached value, dropping it if it has expired."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+
+    if entry[0] <= time.monotonic():
+        del cache[key]
+        return None
+
+    return entry[1]
+
+
+def _cache_put(
+    cache: Dict[_K, Tuple[float, _V]], key: _K, value: _V, expires_at: float, limit: int
+) -> None:
+    """Cache a value, evicting expired and then the oldest entries."""
+    cache.pop(key, None)
+    cache[key] = (expires_at, value)
+
+    # Every entry shares one TTL, so insertion order is expiry order
+    now = time.monotonic()
+    while cache:
+        oldest = next(iter(cache))
+        if len(cache) <= limit and cache[oldest][0] > now:
+            break
+        del cache[oldest]
+
+
+def _area_wiql(area_path: str, states: Optional[List[WorkItemState]]) -> str:
+    """Build the WIQL query for work items under an area path."""
+    return _WIQL_BY_AREA.format(
+        value=_wiql_literal(area_path), states=_wiql_state_clause(states)
+    )
+
+
+def _assigned_to_wiql(assigned_to: str, states: Optional[List[WorkItemState]]) -> str:
+    """Build the WIQL query for work items assigned to a person."""
+    return _WIQL_BY_ASSIGNED_TO.format(
+        value=_wiql_assignee(assigned_to), states=_wiql_state_clause(states)
+    )
+
 
 class AzureDevOpsWorkItemRepository(WorkItemRepository):
     """Repository implementation for Azure DevOps work items.
@@ -19,13 +128,51 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
     the Azure DevOps API client.
     """
 
-    def __init__(self, ado_client: AzureDevOpsClient):
+    def __init__(
+        self,
+        ado_client: AzureDevOpsClient,
+        cache_ttl: float = QUERY_CACHE_TTL,
+        max_cached_queries: int = MAX_CACHED_QUERIES,
+        max_cached_items: int = MAX_CACHED_ITEMS,
+    ):
         """Initialize repository with Azure DevOps client.
 
         Args:
             ado_client: Azure DevOps API client
+            cache_ttl: Seconds to keep query results and work items cached
+            max_cached_queries: Maximum number of WIQL results to keep
+            max_cached_items: Maximum number of work items to keep
         """
         self.client = ado_client
+        self.cache_ttl = cache_ttl
+        self.max_cached_queries = max_cached_queries
+        self.max_cached_items = max_cached_items
+
+        # L1: WIQL digest -> (expires_at, work items), oldest first
+        self._query_cache: Dict[bytes, Tuple[float, List[WorkItem]]] = {}
+        # L2: work item ID -> (expires_at, work item), oldest first
+        self._item_cache: Dict[int, Tuple[float, WorkItem]] = {}
+
+    def _get_cached_item(self, work_item_id: int) -> Optional[WorkItem]:
+        """Get a work item from the L2 cache if it has not expired."""
+        return _cache_get(self._item_cache, work_item_id)
+
+    def _cache_items(self, work_items: List[WorkItem]) -> None:
+        """Store work items in the L2 cache."""
+        expires_at = time.monotonic() + self.cache_ttl
+        for work_item in work_items:
+            _cache_put(
+                self._item_cache,
+                int(work_item.id),
+                work_item,
+                expires_at,
+                self.max_cached_items,
+            )
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached query results and work items."""
+        self._query_cache.clear()
+        self._item_cache.clear()
 
     async def get_by_id(self, work_item_id: WorkItemId) -> Optional[WorkItem]:
         """Get a work item by its ID.
@@ -36,7 +183,15 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
         Returns:
             WorkItem if found, None otherwise
         """
-        return await self.client.get_work_item(int(work_item_id))
+        cached = self._get_cached_item(int(work_item_id))
+        if cached:
+            return cached
+
+        work_item = await self.client.get_work_item(int(work_item_id))
+        if work_item:
+            self._cache_items([work_item])
+
+        return work_item
 
     async def get_by_ids(self, work_item_ids: Set[WorkItemId]) -> List[WorkItem]:
         """Get multiple work items by their IDs.
@@ -47,7 +202,22 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
         Returns:
             List of found work items
         """
-        return await self.client.get_work_items_by_ids(work_item_ids)
+        work_items = []
+        missing_ids = set()
+
+        for work_item_id in work_item_ids:
+            cached = self._get_cached_item(int(work_item_id))
+            if cached:
+                work_items.append(cached)
+            else:
+                missing_ids.add(work_item_id)
+
+        if missing_ids:
+            fetched = await self.client.get_work_items_by_ids(missing_ids)
+            self._cache_items(fetched)
+            work_items.extend(fetched)
+
+        return work_items
 
     async def get_by_iteration(
         self, iteration_path: str, states: Optional[List[WorkItemState]] = None
@@ -81,19 +251,24 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
         Returns:
             List of work items in the area
         """
-        # Build WIQL query
-        wiql = f"""
-        SELECT [System.Id]
-        FROM WorkItems
-        WHERE [System.TeamProject] = '{self.client.project}'
-          AND [System.AreaPath] UNDER '{area_path}'
-        """
+        return await self.query(_area_wiql(area_path, states))
 
-        if states:
-            states_str = "', '".join([s.value for s in states])
-            wiql += f" AND [System.State] IN ('{states_str}')"
+    async def iter_by_area(
+        self, area_path: str, states: Optional[List[WorkItemState]] = None
+    ) -> AsyncIterator[WorkItem]:
+        """Stream work items in a specific area, one page at a time.
 
-        return await self.client.get_work_items_by_query(wiql)
+        Args:
+            area_path: The area path
+            states: Optional filter by states
+
+        Yields:
+            Work items in the area
+        """
+        async for work_item in self.client.iter_work_items_by_query(
+            _area_wiql(area_path, states)
+        ):
+            yield work_item
 
     async def get_by_assigned_to(
         self, assigned_to: str, states: Optional[List[WorkItemState]] = None
@@ -101,27 +276,32 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
         """Get work items assigned to a specific person.
 
         Args:
-            assigned_to: The person's name or email
+            assigned_to: The person's name or email, or ``@Me`` for the
+                authenticated user
             states: Optional filter by states
 
         Returns:
             List of work items assigned to the person
         """
-        # Build WIQL query
-        wiql = f"""
-        SELECT [System.Id]
-        FROM WorkItems
-        WHERE [System.TeamProject] = '{self.client.project}'
-          AND [System.AssignedTo] = '{assigned_to}'
-        """
+        return await self.query(_assigned_to_wiql(assigned_to, states))
 
-        if states:
-            states_str = "', '".join([s.value for s in states])
-            wiql += f" AND [System.State] IN ('{states_str}')"
+    async def iter_by_assigned_to(
+        self, assigned_to: str, states: Optional[List[WorkItemState]] = None
+    ) -> AsyncIterator[WorkItem]:
+        """Stream work items assigned to a person, one page at a time.
 
-        wiql += " ORDER BY [System.ChangedDate] DESC"
+        Args:
+            assigned_to: The person's name or email, or ``@Me`` for the
+                authenticated user
+            states: Optional filter by states
 
-        return await self.client.get_work_items_by_query(wiql)
+        Yields:
+            Work items assigned to the person, most recently changed first
+        """
+        async for work_item in self.client.iter_work_items_by_query(
+            _assigned_to_wiql(assigned_to, states)
+        ):
+            yield work_item
 
     async def get_by_type(
         self, work_item_type: WorkItemType, states: Optional[List[WorkItemState]] = None
@@ -135,19 +315,12 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
         Returns:
             List of work items of the specified type
         """
-        # Build WIQL query
-        wiql = f"""
-        SELECT [System.Id]
-        FROM WorkItems
-        WHERE [System.TeamProject] = '{self.client.project}'
-          AND [System.WorkItemType] = '{work_item_type.value}'
-        """
-
-        if states:
-            states_str = "', '".join([s.value for s in states])
-            wiql += f" AND [System.State] IN ('{states_str}')"
+        wiql = _WIQL_BY_TYPE.format(
+            value=_wiql_literal(work_item_type.value),
+            states=_wiql_state_clause(states),
+        )
 
-        return await self.client.get_work_items_by_query(wiql)
+        return await self.query(wiql)
 
     async def search_by_title(
         self, title_pattern: str, states: Optional[List[WorkItemState]] = None
@@ -161,19 +334,11 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
         Returns:
             List of work items matching the pattern
         """
-        # Build WIQL query with CONTAINS for title search
-        wiql = f"""
-        SELECT [System.Id]
-        FROM WorkItems
-        WHERE [System.TeamProject] = '{self.client.project}'
-          AND [System.Title] CONTAINS '{title_pattern}'
-        """
-
-        if states:
-            states_str = "', '".join([s.value for s in states])
-            wiql += f" AND [System.State] IN ('{states_str}')"
+        wiql = _WIQL_BY_TITLE.format(
+            value=_wiql_literal(title_pattern), states=_wiql_state_clause(states)
+        )
 
-        return await self.client.get_work_items_by_query(wiql)
+        return await self.query(wiql)
 
     async def get_children(self, parent_id: WorkItemId) -> List[WorkItem]:
         """Get child work items of a parent.
@@ -184,16 +349,9 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
         Returns:
             List of child work items
         """
-        # Build WIQL query for children
-        wiql = f"""
-        SELECT [System.Id]
-        FROM WorkItemLinks
-        WHERE [Source].[System.Id] = {int(parent_id)}
-          AND [System.Links.LinkType] = 'System.LinkTypes.Hierarchy-Forward'
-        MODE (Recursive)
-        """
+        wiql = _WIQL_CHILDREN.format(parent_id=int(parent_id))
 
-        return await self.client.get_work_items_by_query(wiql)
+        return await self.query(wiql)
 
     async def save(self, work_item: WorkItem) -> WorkItem:
         """Save a work item.
@@ -205,7 +363,7 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
             The saved work item
         """
         # Create new work item
-        return await self.client.create_work_item(
+        saved_item = await self.client.create_work_item(
             work_item_type=work_item.work_item_type.value,
             title=work_item.title,
             assigned_to=work_item.assigned_to,
@@ -215,6 +373,11 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
             parent_id=int(work_item.parent_id) if work_item.parent_id else None,
         )
 
+        # Cached query results may no longer reflect the project
+        self.invalidate_cache()
+
+        return saved_item
+
     async def save_batch(self, work_items: List[WorkItem]) -> List[WorkItem]:
         """Save multiple work items.
 
@@ -224,17 +387,19 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
         Returns:
             List of saved work items
         """
-        saved_items = []
+        semaphore = asyncio.Semaphore(SAVE_BATCH_CONCURRENCY)
 
-        for item in work_items:
-            try:
-                saved_item = await self.save(item)
-                saved_items.append(saved_item)
-            except Exception as e:
-                logger.error(f"Failed to save work item: {e}")
-                continue
+        async def _save(item: WorkItem) -> Optional[WorkItem]:
+            async with semaphore:
+                try:
+                    return await self.save(item)
+                except Exception as e:
+                    logger.error(f"Failed to save work item: {e}")
+                    return None
 
-        return saved_items
+        results = await asyncio.gather(*(_save(item) for item in work_items))
+
+        return [item for item in results if item is not None]
 
     async def query(self, wiql: str) -> List[WorkItem]:
         """Execute a WIQL query.
@@ -245,4 +410,21 @@ class AzureDevOpsWorkItemRepository(WorkItemRepository):
         Returns:
             List of work items matching the query
         """
-        return await self.client.get_work_items_by_query(wiql)
+        key = hashlib.blake2b(wiql.encode()).digest()
+
+        cached = _cache_get(self._query_cache, key)
+        if cached is not None:
+            return list(cached)
+
+        work_items = await self.client.get_work_items_by_query(wiql)
+
+        _cache_put(
+            self._query_cache,
+            key,
+            work_items,
+            time.monotonic() + self.cache_ttl,
+            self.max_cached_queries,
+        )
+        self._cache_items(work_items)
+
+        return list(work_items)
@@ -1,6 +1,7 @@
 """Clockify implementation of TimeEntryRepository."""
 
 from typing import List, Optional
+import asyncio
 import logging
 
 from ...domain.repositories import TimeEntryRepository
@@ -10,6 +11,9 @@ from ..api_clients import ClockifyClient
 
 logger = logging.getLogger(__name__)
 
+# Clockify allows ~10 requests/second per workspace
+SAVE_BATCH_CONCURRENCY = 10
+
 
 class ClockifyTimeEntryRepository(TimeEntryRepository):
     """Repository implementation for Clockify time entries.
@@ -119,12 +123,7 @@ class ClockifyTimeEntryRepository(TimeEntryRepository):
         all_entries = await self.get_by_date_range(date_range)
 
         # Filter entries without work item IDs in description
-        unmatched = []
-        for entry in all_entries:
-            if not entry.is_matched:
-                unmatched.append(entry)
-
-        return unmatched
+        return [entry for entry in all_entries if not entry.is_matched]
 
     async def save(self, time_entry: TimeEntry) -> TimeEntry:
         """Save a time entry.
@@ -158,17 +157,19 @@ class ClockifyTimeEntryRepository(TimeEntryRepository):
         Returns:
             List of saved time entries
         """
-        saved_entries = []
+        semaphore = asyncio.Semaphore(SAVE_BATCH_CONCURRENCY)
+
+        async def _save(entry: TimeEntry) -> Optional[TimeEntry]:
+            async with semaphore:
+                try:
+                    return await self.save(entry)
+                except Exception as e:
+                    logger.error(f"Failed to save time entry: {e}")
+                    return None
 
-        for entry in time_entries:
-            try:
-                saved_entry = await self.save(entry)
-                saved_entries.append(saved_entry)
-            except Exception as e:
-                logger.error(f"Failed to save time entry: {e}")
-                continue
+        results = await asyncio.gather(*(_save(entry) for entry in time_entries))
 
-        return saved_entries
+        return [entry for entry in results if entry is not None]
 
     async def delete(self, entry_id: str) -> bool:
         """Delete a time entry.
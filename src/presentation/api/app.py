@@ -1,12 +1,63 @@
 """FastAPI application factory."""
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
+from ...infrastructure.adapters import create_report_status_store
+from ...infrastructure.api_clients.base_client import HTTP2_AVAILABLE
 from ...infrastructure.config import get_settings
 from .routers import reports, health, websockets
 from .pipelines import azure_devops, github, clockify
+from .pipelines.azure_devops.service import AzureDevOpsService
+from .pipelines.clockify.service import ClockifyService
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage resources shared across requests.
+
+    Args:
+        app: FastAPI application
+    """
+    settings = get_settings()
+
+    # Keeps connections warm across requests to APIs without their own client
+    app.state.http_client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=30,
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=100, keepalive_expiry=60
+        ),
+    )
+    app.state.ado_service = AzureDevOpsService()
+    app.state.clockify_service = ClockifyService()
+    app.state.report_status_store = create_report_status_store(settings)
+
+    # Build the OpenAPI schema now rather than on the first /api/docs hit
+    app.openapi()
+
+    sweeper = asyncio.create_task(
+        reports.sweep_report_files(
+            app.state.report_status_store, settings.report_output_directory
+        )
+    )
+
+    yield
+
+    # Let the sweeper finish unwinding before the resources it uses close
+    sweeper.cancel()
+    with suppress(asyncio.CancelledError):
+        await sweeper
+
+    await app.state.http_client.aclose()
+    await app.state.ado_service.close()
+    await app.state.clockify_service.close()
+    await app.state.report_status_store.close()
 
 
 def create_app() -> FastAPI:
@@ -24,15 +75,17 @@ def create_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["http://localhost:3000"],  # Next.js default port
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "DELETE"],
+        allow_headers=["Authorization", "Content-Type"],
     )
 
     # Include routers
@@ -52,12 +105,15 @@ def create_app() -> FastAPI:
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
         """Global exception handler."""
+        # Only format the exception in debug mode: some __str__ implementations
+        # (e.g. httpx errors) render full request/response bodies.
+        message = "An error occurred"
+        if settings.debug:
+            message = str(exc)
+
         return JSONResponse(
             status_code=500,
-            content={
-                "error": "Internal server error",
-                "message": str(exc) if settings.debug else "An error occurred",
-            },
+            content={"error": "Internal server error", "message": message},
         )
 
     return app
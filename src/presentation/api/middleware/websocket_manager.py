@@ -1,21 +1,41 @@
 """WebSocket connection manager for real-time updates."""
 
+import asyncio
 import logging
+from collections import defaultdict
 from typing import Dict, Set
+
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
 
+def _encode(message: dict) -> str:
+    """Serialize a message as JSON text, stringifying unsupported values.
+
+    Args:
+        message: Message dictionary
+
+    Returns:
+        JSON text
+    """
+    return orjson.dumps(message, default=str).decode()
+
+
 class WebSocketManager:
     """Manages WebSocket connections and broadcasts."""
 
+    __slots__ = ("active_connections", "all_connections", "ws_reports")
+
     def __init__(self):
         """Initialize WebSocket manager."""
         # Store active connections: {report_id: set of websockets}
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         # Store all connections
         self.all_connections: Set[WebSocket] = set()
+        # Reverse index: {websocket: set of subscribed report_ids}
+        self.ws_reports: Dict[WebSocket, Set[str]] = defaultdict(set)
 
     async def connect(self, websocket: WebSocket, report_id: str = None):
         """Accept and register a new WebSocket connection.
@@ -31,24 +51,29 @@ class WebSocketManager:
             if report_id not in self.active_connections:
                 self.active_connections[report_id] = set()
             self.active_connections[report_id].add(websocket)
+            self.ws_reports[websocket].add(report_id)
 
         logger.info(
             f"WebSocket connected. Report ID: {report_id}, Total connections: {len(self.all_connections)}"
         )
 
     def disconnect(self, websocket: WebSocket, report_id: str = None):
-        """Remove a WebSocket connection.
+        """Remove a WebSocket connection and all of its report subscriptions.
 
         Args:
             websocket: WebSocket connection
-            report_id: Optional report ID to unsubscribe from
+            report_id: Optional report ID, used for logging only; subscriptions
+                are looked up from the connection itself
         """
         self.all_connections.discard(websocket)
 
-        if report_id and report_id in self.active_connections:
-            self.active_connections[report_id].discard(websocket)
-            if not self.active_connections[report_id]:
-                del self.active_connections[report_id]
+        for subscribed_id in self.ws_reports.pop(websocket, ()):
+            connections = self.active_connections.get(subscribed_id)
+            if connections is None:
+                continue
+            connections.discard(websocket)
+            if not connections:
+                del self.active_connections[subscribed_id]
 
         logger.info(
             f"WebSocket disconnected. Report ID: {report_id}, Total connections: {len(self.all_connections)}"
@@ -61,11 +86,20 @@ class WebSocketManager:
             message: Message dictionary
             websocket: Target WebSocket connection
         """
+        await self.send_personal_text(_encode(message), websocket)
+
+    async def send_personal_text(self, text: str, websocket: WebSocket):
+        """Send pre-encoded JSON text to a specific WebSocket connection.
+
+        Args:
+            text: JSON text
+            websocket: Target WebSocket connection
+        """
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(text)
         except Exception as e:
             logger.error(f"Failed to send personal message: {e}")
-            self.all_connections.discard(websocket)
+            self.disconnect(websocket)
 
     async def broadcast_to_report(self, report_id: str, message: dict):
         """Broadcast a message to all connections subscribed to a report.
@@ -74,21 +108,25 @@ class WebSocketManager:
             report_id: Report ID
             message: Message dictionary
         """
-        if report_id not in self.active_connections:
+        subscribers = self.active_connections.get(report_id)
+        if not subscribers:
             return
 
-        disconnected = set()
+        # Serialize once for all subscribers
+        payload = _encode(message)
 
-        for connection in self.active_connections[report_id]:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Failed to send to connection: {e}")
-                disconnected.add(connection)
+        # Snapshot so disconnects during the sends cannot resize the set
+        connections = tuple(subscribers)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected connections
-        for connection in disconnected:
-            self.disconnect(connection, report_id)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send to connection: {result}")
+                self.disconnect(connection, report_id)
 
     async def broadcast_to_all(self, message: dict):
         """Broadcast a message to all active connections.
@@ -96,18 +134,20 @@ class WebSocketManager:
         Args:
             message: Message dictionary
         """
-        disconnected = set()
+        # Serialize once for all connections
+        payload = _encode(message)
 
-        for connection in self.all_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Failed to broadcast to connection: {e}")
-                disconnected.add(connection)
+        connections = list(self.all_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected connections
-        for connection in disconnected:
-            self.all_connections.discard(connection)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to broadcast to connection: {result}")
+                self.disconnect(connection)
 
     async def send_progress_update(self, report_id: str, progress: float, message: str):
         """Send a progress update for a report.
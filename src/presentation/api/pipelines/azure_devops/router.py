@@ -1,6 +1,6 @@
 """Azure DevOps pipeline router."""
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 
 from .schemas import WorkItemQueryRequest, WorkItemBatchResponse, ADOConnectionResponse
 from .service import AzureDevOpsService
@@ -8,9 +8,9 @@ from .service import AzureDevOpsService
 router = APIRouter()
 
 
-def get_ado_service() -> AzureDevOpsService:
-    """Dependency to get Azure DevOps service."""
-    return AzureDevOpsService()
+def get_ado_service(request: Request) -> AzureDevOpsService:
+    """Dependency to get the application-scoped Azure DevOps service."""
+    return request.app.state.ado_service
 
 
 @router.get("/connection", response_model=ADOConnectionResponse)
@@ -20,17 +20,14 @@ async def check_connection(service: AzureDevOpsService = Depends(get_ado_service
     Returns:
         Connection status
     """
-    try:
-        connected = await service.test_connection()
+    connected = await service.test_connection()
 
-        return ADOConnectionResponse(
-            connected=connected,
-            organization=service.settings.ado_organization,
-            project=service.settings.ado_project,
-            message="Connected successfully" if connected else "Connection failed",
-        )
-    finally:
-        await service.close()
+    return ADOConnectionResponse(
+        connected=connected,
+        organization=service.settings.ado_organization,
+        project=service.settings.ado_project,
+        message="Connected successfully" if connected else "Connection failed",
+    )
 
 
 @router.post("/work-items", response_model=WorkItemBatchResponse)
@@ -51,5 +48,3 @@ async def get_work_items(
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        await service.close()
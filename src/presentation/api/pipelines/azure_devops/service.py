@@ -1,18 +1,35 @@
 """Azure DevOps pipeline service."""
 
 import logging
-from typing import List
+from datetime import datetime
+from typing import Any, List, Optional
 
 from .....infrastructure.config import get_settings
 from .....infrastructure.api_clients import AzureDevOpsClient
 from .....infrastructure.repositories import AzureDevOpsWorkItemRepository
+from .....domain.value_objects import WorkItemId
 from .schemas import WorkItemResponse, WorkItemBatchResponse
 
 logger = logging.getLogger(__name__)
 
 
+def _enum_value(value: Any) -> str:
+    """Get the string value of an enum member, or str() of anything else."""
+    return value.value if hasattr(value, "value") else str(value)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime as ISO 8601."""
+    return value.isoformat() if value else None
+
+
 class AzureDevOpsService:
-    """Service for Azure DevOps operations."""
+    """Service for Azure DevOps operations.
+
+    One instance is shared by all requests (see ``app.state``) so the
+    underlying client keeps its connection pool warm; it is closed when the
+    application shuts down.
+    """
 
     def __init__(self):
         """Initialize Azure DevOps service."""
@@ -58,44 +75,37 @@ class AzureDevOpsService:
         await self.initialize()
 
         try:
-            # Fetch work items from repository
-            work_items = []
-            for work_item_id in work_item_ids:
+            ids = []
+            for raw_id in dict.fromkeys(work_item_ids):
                 try:
-                    wi = await self.repository.get_by_id(work_item_id)
-                    if wi:
-                        work_items.append(
-                            WorkItemResponse(
-                                id=wi.id,
-                                title=wi.title,
-                                type=(
-                                    wi.type.value
-                                    if hasattr(wi.type, "value")
-                                    else str(wi.type)
-                                ),
-                                state=(
-                                    wi.state.value
-                                    if hasattr(wi.state, "value")
-                                    else str(wi.state)
-                                ),
-                                assigned_to=getattr(wi, "assigned_to", None),
-                                created_date=(
-                                    wi.created_date.isoformat()
-                                    if wi.created_date
-                                    else None
-                                ),
-                                changed_date=(
-                                    wi.changed_date.isoformat()
-                                    if wi.changed_date
-                                    else None
-                                ),
-                            )
-                        )
-                except Exception as e:
-                    logger.error(f"Failed to fetch work item {work_item_id}: {e}")
-                    continue
-
-            return WorkItemBatchResponse(work_items=work_items, count=len(work_items))
+                    ids.append(WorkItemId(raw_id))
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Skipping invalid work item ID {raw_id}: {e}")
+
+            # The client already splits IDs into bounded, concurrent batches
+            fetched = await self.repository.get_by_ids(set(ids))
+
+            # Answer in the caller's order; missing IDs are left out
+            by_id = {int(wi.id): wi for wi in fetched}
+            ordered = [by_id[int(wi_id)] for wi_id in ids if int(wi_id) in by_id]
+
+            # Data comes from the trusted repository, so skip re-validation
+            work_items = [
+                WorkItemResponse.model_construct(
+                    id=int(wi.id),
+                    title=wi.title,
+                    type=_enum_value(wi.work_item_type),
+                    state=_enum_value(wi.state),
+                    assigned_to=wi.assigned_to,
+                    created_date=_isoformat(wi.created_date),
+                    changed_date=_isoformat(wi.changed_date),
+                )
+                for wi in ordered
+            ]
+
+            return WorkItemBatchResponse.model_construct(
+                work_items=work_items, count=len(work_items)
+            )
 
         except Exception as e:
             logger.error(f"Failed to get work items: {e}")
@@ -1,6 +1,7 @@
 """Clockify pipeline router."""
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
 
 from .schemas import (
     TimeEntryQueryRequest,
@@ -13,9 +14,9 @@ from .service import ClockifyService
 router = APIRouter()
 
 
-def get_clockify_service() -> ClockifyService:
-    """Dependency to get Clockify service."""
-    return ClockifyService()
+def get_clockify_service(request: Request) -> ClockifyService:
+    """Dependency to get the application-scoped Clockify service."""
+    return request.app.state.clockify_service
 
 
 @router.post("/connection", response_model=ClockifyConnectionResponse)
@@ -31,16 +32,13 @@ async def check_connection(
     Returns:
         Connection status
     """
-    try:
-        connected = await service.test_connection()
+    connected = await service.test_connection()
 
-        return ClockifyConnectionResponse(
-            connected=connected,
-            workspace_id=service.settings.clockify_workspace_id,
-            message="Connected successfully" if connected else "Connection failed",
-        )
-    finally:
-        await service.close()
+    return ClockifyConnectionResponse(
+        connected=connected,
+        workspace_id=service.settings.clockify_workspace_id,
+        message="Connected successfully" if connected else "Connection failed",
+    )
 
 
 @router.post("/time-entries", response_model=TimeEntryBatchResponse)
@@ -63,8 +61,6 @@ async def get_time_entries(
             user_ids=request.user_ids,
             project_ids=request.project_ids,
         )
-        return result
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        await service.close()
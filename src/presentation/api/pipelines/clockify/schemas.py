@@ -17,9 +17,9 @@ class TimeEntryResponse(BaseModel):
     """Response model for time entry."""
 
     id: str
-    description: str
+    description: Optional[str] = None
     start: str
-    end: str
+    end: Optional[str] = None
     duration_hours: float
     user_id: str
     user_name: str
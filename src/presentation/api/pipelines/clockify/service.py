@@ -1,20 +1,41 @@
 """Clockify pipeline service."""
 
 import logging
+import sys
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from .....infrastructure.config import get_settings
 from .....infrastructure.api_clients import ClockifyClient
 from .....infrastructure.repositories import ClockifyTimeEntryRepository
 from .....domain.value_objects import DateRange
-from .schemas import TimeEntryResponse, TimeEntryBatchResponse
 
 logger = logging.getLogger(__name__)
 
+# ciso8601 is a faster C parser; stdlib fromisoformat accepts a trailing "Z"
+# only from Python 3.11
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_datetime = datetime.fromisoformat
+    else:
+
+        def _parse_datetime(value: str) -> datetime:
+            """Parse an ISO 8601 timestamp, accepting a trailing "Z"."""
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+_isoformat = datetime.isoformat
+
 
 class ClockifyService:
-    """Service for Clockify operations."""
+    """Service for Clockify operations.
+
+    One instance is shared by all requests (see ``app.state``) so the
+    underlying client keeps its connection pool warm; it is closed when the
+    application shuts down.
+    """
 
     def __init__(self):
         """Initialize Clockify service."""
@@ -54,7 +75,7 @@ class ClockifyService:
         end_date: str,
         user_ids: Optional[List[str]] = None,
         project_ids: Optional[List[str]] = None,
-    ) -> TimeEntryBatchResponse:
+    ) -> Dict[str, Any]:
         """Get time entries for a date range.
 
         Args:
@@ -64,48 +85,55 @@ class ClockifyService:
             project_ids: Optional list of project IDs to filter
 
         Returns:
-            Batch response with time entries
+            Batch response dictionary in the TimeEntryBatchResponse shape
         """
         await self.initialize()
 
         try:
             # Parse dates
-            start = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-            end = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+            start = _parse_datetime(start_date)
+            end = _parse_datetime(end_date)
             date_range = DateRange(start, end)
 
-            # Fetch time entries
+            # The repository filters by at most one user and one project
+            # server-side; wider filters are applied to the results
             entries = await self.repository.get_by_date_range(
-                date_range, user_ids=user_ids, project_ids=project_ids
-            )
-
-            # Convert to response models
-            time_entries = []
-            total_hours = 0.0
-
-            for entry in entries:
-                duration_hours = entry.duration.total_seconds() / 3600
-                total_hours += duration_hours
-
-                time_entries.append(
-                    TimeEntryResponse(
-                        id=entry.id,
-                        description=entry.description,
-                        start=entry.start_time.isoformat(),
-                        end=entry.end_time.isoformat() if entry.end_time else None,
-                        duration_hours=round(duration_hours, 2),
-                        user_id=entry.user_id,
-                        user_name=entry.user_name,
-                        project_id=getattr(entry, "project_id", None),
-                        project_name=getattr(entry, "project_name", None),
-                    )
-                )
-
-            return TimeEntryBatchResponse(
-                time_entries=time_entries,
-                count=len(time_entries),
-                total_hours=round(total_hours, 2),
+                date_range,
+                user_id=user_ids[0] if user_ids and len(user_ids) == 1 else None,
+                project_id=(
+                    project_ids[0] if project_ids and len(project_ids) == 1 else None
+                ),
             )
+            if user_ids:
+                user_id_set = set(user_ids)
+                entries = [e for e in entries if e.user_id in user_id_set]
+            if project_ids:
+                project_id_set = set(project_ids)
+                entries = [e for e in entries if e.project_id in project_id_set]
+
+            durations = [entry.duration.hours for entry in entries]
+
+            # Plain dicts: the batch is only ever serialized, never validated
+            time_entries = [
+                {
+                    "id": entry.id,
+                    "description": entry.description,
+                    "start": _isoformat(entry.start_time),
+                    "end": _isoformat(entry.end_time) if entry.end_time else None,
+                    "duration_hours": round(duration_hours, 2),
+                    "user_id": entry.user_id,
+                    "user_name": entry.user_name,
+                    "project_id": entry.project_id,
+                    "project_name": entry.project_name,
+                }
+                for entry, duration_hours in zip(entries, durations)
+            ]
+
+            return {
+                "time_entries": time_entries,
+                "count": len(time_entries),
+                "total_hours": round(sum(durations), 2),
+            }
 
         except Exception as e:
             logger.error(f"Failed to get time entries: {e}")
@@ -1,11 +1,17 @@
 """GitHub pipeline router."""
 
 import logging
-from fastapi import APIRouter
+from functools import lru_cache
+from typing import Optional
 
+import httpx
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
+
+from .....application.ports import CacheService
+from .....infrastructure.config import get_settings
 from .schemas import (
     GitHubIssueRequest,
-    GitHubIssueResponse,
     GitHubBatchResponse,
     GitHubConnectionRequest,
     GitHubConnectionResponse,
@@ -16,68 +22,76 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_cache_service() -> Optional[CacheService]:
+    """Get the cache used for conditional GitHub requests, if caching is enabled.
+
+    Built once; the cache keeps no per-request state.
+
+    Returns:
+        Cache service or None
+    """
+    settings = get_settings()
+    if not settings.enable_caching:
+        return None
+
+    from .....infrastructure.adapters import LocalCacheService
+
+    return LocalCacheService(settings.cache_directory)
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Dependency to get the application-scoped HTTP client."""
+    return request.app.state.http_client
+
+
 @router.post("/connection", response_model=GitHubConnectionResponse)
-async def check_connection(request: GitHubConnectionRequest):
+async def check_connection(
+    request: GitHubConnectionRequest,
+    client: httpx.AsyncClient = Depends(get_http_client),
+):
     """Check GitHub connection status.
 
     Args:
         request: Connection request with optional token
+        client: Shared HTTP client
 
     Returns:
         Connection status
     """
-    service = GitHubService(token=request.token)
-
-    connected, rate_limit = await service.test_connection()
-
-    return GitHubConnectionResponse(
-        connected=connected,
-        rate_limit_remaining=rate_limit,
-        message="Connected successfully" if connected else "Connection failed",
+    async with GitHubService(token=request.token, client=client) as service:
+        connected, rate_limit = await service.test_connection()
+
+    return ORJSONResponse(
+        {
+            "connected": connected,
+            "rate_limit_remaining": rate_limit,
+            "message": "Connected successfully" if connected else "Connection failed",
+        }
     )
 
 
 @router.post("/issues", response_model=GitHubBatchResponse)
-async def get_issues(request: GitHubIssueRequest):
+async def get_issues(
+    request: GitHubIssueRequest,
+    client: httpx.AsyncClient = Depends(get_http_client),
+):
     """Get GitHub issues by numbers.
 
     Args:
         request: Issue query request
+        client: Shared HTTP client
 
     Returns:
         Issues data
     """
-    service = GitHubService()
-
-    issues = []
-
-    for issue_number in request.issue_numbers:
-        try:
-            issue_data = await service.get_issue(
-                request.owner, request.repo, issue_number
-            )
-
-            if issue_data:
-                issues.append(
-                    GitHubIssueResponse(
-                        number=issue_data["number"],
-                        title=issue_data["title"],
-                        state=issue_data["state"],
-                        assignee=(
-                            issue_data.get("assignee", {}).get("login")
-                            if issue_data.get("assignee")
-                            else None
-                        ),
-                        created_at=issue_data["created_at"],
-                        updated_at=issue_data["updated_at"],
-                        labels=[
-                            label["name"] for label in issue_data.get("labels", [])
-                        ],
-                    )
-                )
-
-        except Exception as e:
-            logger.error(f"Failed to fetch issue {issue_number}: {e}")
-            continue
-
-    return GitHubBatchResponse(issues=issues, count=len(issues))
+    async with GitHubService(
+        token=request.token, cache_service=_get_cache_service(), client=client
+    ) as service:
+        issues = await service.get_issues_batch(
+            request.owner, request.repo, request.issue_numbers
+        )
+
+    # Returning a response directly skips FastAPI's response_model
+    # validation; the model is still used for the OpenAPI schema
+    return ORJSONResponse({"issues": issues, "count": len(issues)})
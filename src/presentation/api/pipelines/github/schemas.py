@@ -10,6 +10,9 @@ class GitHubIssueRequest(BaseModel):
     owner: str = Field(..., description="Repository owner")
     repo: str = Field(..., description="Repository name")
     issue_numbers: List[int] = Field(..., description="List of issue numbers")
+    token: Optional[str] = Field(
+        None, description="GitHub Personal Access Token (enables GraphQL batching)"
+    )
 
 
 class GitHubIssueResponse(BaseModel):
@@ -1,36 +1,115 @@
 """GitHub pipeline service."""
 
+import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 import httpx
 
+from .....application.ports import CacheService
+from .....infrastructure.api_clients.base_client import HTTP2_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of aliased issues requested in one GraphQL query
+GRAPHQL_BATCH_SIZE = 100
+
+_ISSUE_FIELDS_FRAGMENT = (
+    "fragment IssueFields on Issue {"
+    " number title state createdAt updatedAt"
+    " assignees(first: 1) { nodes { login } }"
+    " labels(first: 20) { nodes { name } }"
+    " }"
+)
+
+
+def _issue_from_rest(issue_data: dict) -> dict:
+    """Shape a REST API issue as an issue response dictionary.
+
+    Args:
+        issue_data: Issue as returned by the REST API
+
+    Returns:
+        Issue response dictionary
+    """
+    return {
+        "number": issue_data["number"],
+        "title": issue_data["title"],
+        "state": issue_data["state"],
+        "assignee": (issue_data.get("assignee") or {}).get("login"),
+        "created_at": issue_data["created_at"],
+        "updated_at": issue_data["updated_at"],
+        "labels": [label["name"] for label in issue_data.get("labels", [])],
+    }
+
+
+def _issue_from_graphql(node: dict) -> dict:
+    """Shape a GraphQL issue node as an issue response dictionary.
+
+    Args:
+        node: Issue node selected with the IssueFields fragment
+
+    Returns:
+        Issue response dictionary
+    """
+    assignees = node["assignees"]["nodes"]
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "state": node["state"].lower(),
+        "assignee": assignees[0]["login"] if assignees else None,
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "labels": [label["name"] for label in node["labels"]["nodes"]],
+    }
+
 
 class GitHubService:
-    """Service for GitHub operations."""
+    """Service for GitHub operations.
 
-    def __init__(self, token: Optional[str] = None):
+    Use as an async context manager. Requests go through the given HTTP
+    client, or, without one, through a client opened for the duration of
+    the block.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        cache_service: Optional[CacheService] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize GitHub service.
 
         Args:
             token: Optional GitHub Personal Access Token
+            cache_service: Optional cache for conditional (ETag) issue requests
+            client: Optional shared HTTP client; it is left open on exit
         """
         self.token = token
+        self.cache_service = cache_service
         self.base_url = "https://api.github.com"
 
-    def _get_headers(self) -> dict:
-        """Get headers for GitHub API requests.
+        # Sent with each request, since a shared client serves other tokens
+        self._headers = {"Accept": "application/vnd.github.v3+json"}
+        if token:
+            self._headers["Authorization"] = f"token {token}"
 
-        Returns:
-            Headers dictionary
-        """
-        headers = {"Accept": "application/vnd.github.v3+json"}
+        self._client = client
+        self._owns_client = client is None
 
-        if self.token:
-            headers["Authorization"] = f"token {self.token}"
+    async def __aenter__(self):
+        """Open an HTTP client unless a shared one was given."""
+        if self._owns_client:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            )
+        return self
 
-        return headers
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the HTTP client if this service opened it."""
+        if self._owns_client:
+            await self._client.aclose()
+            self._client = None
 
     async def test_connection(self) -> tuple[bool, Optional[int]]:
         """Test GitHub connection and get rate limit.
@@ -39,17 +118,16 @@ class GitHubService:
             Tuple of (connected, rate_limit_remaining)
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/rate_limit", headers=self._get_headers()
-                )
+            response = await self._client.get(
+                f"{self.base_url}/rate_limit", headers=self._headers
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    rate_limit = data.get("rate", {}).get("remaining", 0)
-                    return True, rate_limit
+            if response.status_code == 200:
+                data = response.json()
+                rate_limit = data.get("rate", {}).get("remaining", 0)
+                return True, rate_limit
 
-                return False, None
+            return False, None
 
         except Exception as e:
             logger.error(f"GitHub connection test failed: {e}")
@@ -68,18 +146,170 @@ class GitHubService:
         Returns:
             Issue data or None
         """
+        cache_key = f"github:issue:{owner}/{repo}/{issue_number}"
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}",
-                    headers=self._get_headers(),
-                )
+            cached = None
+            headers = self._headers
+            if self.cache_service:
+                cached = await self.cache_service.get(cache_key)
+                if cached:
+                    headers = {**headers, "If-None-Match": cached["etag"]}
 
-                if response.status_code == 200:
-                    return response.json()
+            response = await self._client.get(
+                f"{self.base_url}/repos/{owner}/{repo}/issues/{issue_number}",
+                headers=headers,
+            )
 
-                return None
+            # Unchanged since the cached copy; 304s do not count against
+            # the rate limit
+            if response.status_code == 304 and cached:
+                return cached["body"]
+
+            if response.status_code == 200:
+                issue = response.json()
+
+                etag = response.headers.get("ETag")
+                if self.cache_service and etag:
+                    await self.cache_service.set(
+                        cache_key, {"etag": etag, "body": issue}
+                    )
+
+                return issue
+
+            return None
 
         except Exception as e:
             logger.error(f"Failed to get GitHub issue: {e}")
             return None
+
+    async def get_issues_batch(
+        self, owner: str, repo: str, issue_numbers: List[int]
+    ) -> List[dict]:
+        """Get several GitHub issues, in the order requested.
+
+        A single issue is fetched directly over REST. Otherwise, with a
+        token, issues are fetched through GraphQL with up to
+        GRAPHQL_BATCH_SIZE issues per query. GraphQL requires
+        authentication, so anonymous requests (and any batch whose query
+        fails) fall back to concurrent REST calls.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            issue_numbers: Issue numbers
+
+        Returns:
+            Issue response dictionaries for the issues that were found
+        """
+        # A single issue is one REST call (which can be answered from the ETag
+        # cache); skip building a GraphQL query or a gather
+        if len(issue_numbers) == 1:
+            issue_data = await self.get_issue(owner, repo, issue_numbers[0])
+            return [_issue_from_rest(issue_data)] if issue_data else []
+
+        if not self.token:
+            return await self._get_issues_rest(owner, repo, issue_numbers)
+
+        chunks = [
+            issue_numbers[i : i + GRAPHQL_BATCH_SIZE]
+            for i in range(0, len(issue_numbers), GRAPHQL_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self._get_issues_graphql(owner, repo, chunk) for chunk in chunks)
+        )
+
+        issues = []
+        for chunk, chunk_issues in zip(chunks, results):
+            if chunk_issues is None:
+                chunk_issues = await self._get_issues_rest(owner, repo, chunk)
+            issues.extend(chunk_issues)
+
+        return issues
+
+    async def _get_issues_graphql(
+        self, owner: str, repo: str, issue_numbers: List[int]
+    ) -> Optional[List[dict]]:
+        """Get issues with a single aliased GraphQL query.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            issue_numbers: Issue numbers
+
+        Returns:
+            Issue response dictionaries, or None if the query failed
+        """
+        aliases = " ".join(
+            f"i{number}: issue(number: {number}) {{ ...IssueFields }}"
+            for number in dict.fromkeys(issue_numbers)
+        )
+        query = (
+            "query($owner: String!, $repo: String!) {"
+            f" repository(owner: $owner, name: $repo) {{ {aliases} }}"
+            " } " + _ISSUE_FIELDS_FRAGMENT
+        )
+
+        try:
+            response = await self._client.post(
+                f"{self.base_url}/graphql",
+                json={"query": query, "variables": {"owner": owner, "repo": repo}},
+                headers=self._headers,
+            )
+
+            if response.status_code != 200:
+                logger.error(f"GitHub GraphQL query failed: {response.status_code}")
+                return None
+
+            repository = (response.json().get("data") or {}).get("repository")
+
+        except Exception as e:
+            logger.error(f"GitHub GraphQL query failed: {e}")
+            return None
+
+        if repository is None:
+            return None
+
+        # Issues that do not exist come back as null aliases
+        return [
+            _issue_from_graphql(repository[f"i{number}"])
+            for number in issue_numbers
+            if repository.get(f"i{number}")
+        ]
+
+    async def _get_issues_rest(
+        self, owner: str, repo: str, issue_numbers: List[int]
+    ) -> List[dict]:
+        """Get issues with one concurrent REST call per issue.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            issue_numbers: Issue numbers
+
+        Returns:
+            Issue response dictionaries for the issues that were found
+        """
+        results = await asyncio.gather(
+            *(
+                self.get_issue(owner, repo, issue_number)
+                for issue_number in issue_numbers
+            ),
+            return_exceptions=True,
+        )
+
+        issues = []
+
+        for issue_number, issue_data in zip(issue_numbers, results):
+            try:
+                if isinstance(issue_data, Exception):
+                    raise issue_data
+
+                if issue_data:
+                    issues.append(_issue_from_rest(issue_data))
+
+            except Exception as e:
+                logger.error(f"Failed to fetch issue {issue_number}: {e}")
+                continue
+
+        return issues
@@ -1,6 +1,9 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from ....infrastructure.config import get_settings
@@ -33,30 +36,45 @@ async def health_check():
     """
     settings = get_settings()
 
-    return HealthResponse(
-        status="healthy",
-        version=settings.app_version,
-        environment=settings.environment.value,
+    return ORJSONResponse(
+        {
+            "status": "healthy",
+            "version": settings.app_version,
+            "environment": settings.environment.value,
+        }
     )
 
 
 @router.get("/health/services", response_model=ServiceStatusResponse)
-async def check_services():
+async def check_services(request: Request):
     """Check external service connections.
 
+    Args:
+        request: Incoming request, used to reach the shared HTTP client
+
     Returns:
         Status of external services
     """
     settings = get_settings()
 
-    clockify_client = ClockifyClient(settings)
-    ado_client = AzureDevOpsClient(settings)
+    # Probe over the app's warm connections rather than opening new pools
+    http_client = request.app.state.http_client
+    clockify_client = ClockifyClient(settings, http_client=http_client)
+    ado_client = AzureDevOpsClient(settings, http_client=http_client)
 
     try:
-        clockify_status = await clockify_client.test_connection()
-        ado_status = await ado_client.test_connection()
-
-        return ServiceStatusResponse(clockify=clockify_status, azure_devops=ado_status)
+        # Probe both services at once; a probe that raises counts as down
+        clockify_status, ado_status = await asyncio.gather(
+            clockify_client.test_connection(),
+            ado_client.test_connection(),
+            return_exceptions=True,
+        )
+
+        return ORJSONResponse(
+            {
+                "clockify": clockify_status is True,
+                "azure_devops": ado_status is True,
+            }
+        )
     finally:
-        await clockify_client.close()
-        await ado_client.close()
+        await asyncio.gather(clockify_client.close(), ado_client.close())
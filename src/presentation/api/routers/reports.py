@@ -1,50 +1,123 @@
 """Report generation endpoints."""
 
-from datetime import datetime, timedelta
+import asyncio
+import logging
+import os
+import stat
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from typing import Optional, List
-from uuid import uuid4
+from typing import Coroutine, Optional, List, Set
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+import httpx
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 
 from ....infrastructure.config import get_settings
-from ....infrastructure.api_clients import ClockifyClient, AzureDevOpsClient
-from ....infrastructure.repositories import (
-    ClockifyTimeEntryRepository,
-    AzureDevOpsWorkItemRepository,
-)
-from ....infrastructure.adapters import ExcelReportGenerator, HTMLReportGenerator
-from ....domain.value_objects import DateRange
-from ....domain.services import MatchingService
-from ....application.use_cases import GenerateReportUseCase
-from ....application.use_cases.generate_report_use_case import (
-    GenerateReportRequest,
-    ReportFormat,
-)
+from ....application.ports import ReportStatusStore
 from ..middleware.websocket_manager import ws_manager
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
+# Minimum seconds between /status polls for one report; clients should follow
+# the report's WebSocket instead
+STATUS_POLL_INTERVAL = 1
 
-# In-memory storage for report status (should use Redis in production)
-report_status_store = {}
+# Seconds between sweeps for report files whose status has expired
+REPORT_SWEEP_INTERVAL = 300
+
+# File extension and download media type for each report format
+_FILE_EXTENSIONS = {"excel": "xlsx", "html": "html", "json": "json"}
+_MEDIA_TYPES = {
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".html": "text/html",
+    ".json": "application/json",
+}
+
+# Strong references to running report tasks so they are not garbage collected
+_report_tasks: Set[asyncio.Task] = set()
+
+
+def _start_report_task(coro: Coroutine) -> asyncio.Task:
+    """Start a report generation task without waiting for the response.
+
+    On Python 3.12+ the task starts eagerly, so its initial status updates
+    run immediately instead of after a trip through the event loop.
+
+    Args:
+        coro: Report generation coroutine
+
+    Returns:
+        The running task
+    """
+    loop = asyncio.get_running_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        task = asyncio.eager_task_factory(loop, coro)
+    else:
+        task = loop.create_task(coro)
+
+    _report_tasks.add(task)
+    task.add_done_callback(_report_tasks.discard)
+    return task
+
+
+async def sweep_report_files(
+    store: ReportStatusStore,
+    output_directory: Path,
+    interval: float = REPORT_SWEEP_INTERVAL,
+):
+    """Periodically delete generated report files whose status has expired.
+
+    Only files named like the API's own output (``report_<uuid>.<ext>``)
+    are considered, so reports written to the same directory by the CLI
+    are left alone.
+
+    Args:
+        store: Report status store
+        output_directory: Directory reports are written to
+        interval: Seconds between sweeps
+    """
+    while True:
+        await asyncio.sleep(interval)
+
+        try:
+            for path in output_directory.glob("report_*"):
+                report_id = path.stem[len("report_") :]
+                try:
+                    UUID(report_id)
+                except ValueError:
+                    continue
+
+                if await store.get(report_id) is None:
+                    path.unlink(missing_ok=True)
+                    logger.info(f"Removed expired report file: {path}")
+        except Exception as e:
+            logger.error(f"Failed to sweep report files: {e}")
+
+
+def get_report_status_store(request: Request) -> ReportStatusStore:
+    """Dependency to get the application-scoped report status store."""
+    return request.app.state.report_status_store
 
 
 class ReportGenerationRequest(BaseModel):
     """Request model for report generation."""
 
-    start_date: Optional[str] = Field(
+    start_date: Optional[date] = Field(
         None, description="Start date in YYYY-MM-DD format. Default: 7 days ago"
     )
-    end_date: Optional[str] = Field(
+    end_date: Optional[date] = Field(
         None, description="End date in YYYY-MM-DD format. Default: today"
     )
     format: str = Field("excel", description="Output format: excel, html, json")
     user_ids: Optional[List[str]] = Field(None, description="Filter by user IDs")
     project_ids: Optional[List[str]] = Field(None, description="Filter by project IDs")
     include_unmatched: bool = Field(True, description="Include unmatched time entries")
+    use_cache: bool = Field(
+        True, description="Reuse cached API results; false forces a refresh"
+    )
 
 
 class ReportGenerationResponse(BaseModel):
@@ -69,13 +142,16 @@ class ReportStatusResponse(BaseModel):
 
 @router.post("/generate", response_model=ReportGenerationResponse)
 async def generate_report(
-    request: ReportGenerationRequest, background_tasks: BackgroundTasks
+    request: ReportGenerationRequest,
+    http_request: Request,
+    store: ReportStatusStore = Depends(get_report_status_store),
 ):
     """Generate a new report.
 
     Args:
         request: Report generation parameters
-        background_tasks: FastAPI background tasks
+        http_request: Incoming request, used to reach the shared HTTP client
+        store: Report status store
 
     Returns:
         Report generation status
@@ -84,125 +160,181 @@ async def generate_report(
     report_id = str(uuid4())
 
     # Initialize status
-    report_status_store[report_id] = {
-        "status": "pending",
-        "progress": 0.0,
-        "message": "Report generation queued",
-    }
-
-    # Add background task
-    background_tasks.add_task(generate_report_task, report_id, request)
-
-    return ReportGenerationResponse(
-        report_id=report_id,
-        status="pending",
-        message="Report generation started",
-        websocket_url=f"/api/ws/report/{report_id}",
+    await store.update(
+        report_id, status="pending", progress=0.0, message="Report generation queued"
+    )
+
+    _start_report_task(
+        generate_report_task(
+            report_id, request, store, http_request.app.state.http_client
+        )
+    )
+
+    # Progress is pushed over the WebSocket; /status is only a fallback
+    return ORJSONResponse(
+        {
+            "report_id": report_id,
+            "status": "pending",
+            "message": "Report generation started",
+            "websocket_url": f"/api/ws/report/{report_id}",
+        },
+        headers={"X-Preferred-Channel": "websocket"},
     )
 
 
 @router.get("/status/{report_id}", response_model=ReportStatusResponse)
-async def get_report_status(report_id: str):
+async def get_report_status(
+    report_id: str, store: ReportStatusStore = Depends(get_report_status_store)
+):
     """Get report generation status.
 
+    For clients that cannot use the report's WebSocket, which pushes every
+    update. Polling is limited to once per STATUS_POLL_INTERVAL per report.
+
     Args:
         report_id: Report ID
+        store: Report status store
 
     Returns:
         Report status
     """
-    if report_id not in report_status_store:
+    status = await store.get(report_id)
+    if status is None:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    status = report_status_store[report_id]
+    if not await store.try_acquire_poll(report_id, STATUS_POLL_INTERVAL):
+        raise HTTPException(
+            status_code=429,
+            detail="Polling too fast; subscribe to the report's WebSocket instead",
+            headers={"Retry-After": str(STATUS_POLL_INTERVAL)},
+        )
 
-    response = ReportStatusResponse(
-        report_id=report_id,
-        status=status["status"],
-        progress=status.get("progress"),
-        message=status.get("message"),
+    return ORJSONResponse(
+        {
+            "report_id": report_id,
+            "status": status["status"],
+            "progress": status.get("progress"),
+            "message": status.get("message"),
+            "download_url": (
+                f"/api/reports/download/{report_id}"
+                if status["status"] == "completed"
+                else None
+            ),
+            "error": status.get("error") if status["status"] == "failed" else None,
+        }
     )
 
-    if status["status"] == "completed":
-        response.download_url = f"/api/reports/download/{report_id}"
-
-    if status["status"] == "failed":
-        response.error = status.get("error")
-
-    return response
-
 
 @router.get("/download/{report_id}")
-async def download_report(report_id: str):
+async def download_report(
+    report_id: str, store: ReportStatusStore = Depends(get_report_status_store)
+):
     """Download generated report.
 
     Args:
         report_id: Report ID
+        store: Report status store
 
     Returns:
         Report file
     """
-    if report_id not in report_status_store:
+    status = await store.get(report_id)
+    if status is None:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    status = report_status_store[report_id]
-
     if status["status"] != "completed":
         raise HTTPException(status_code=400, detail="Report not ready")
 
     file_path = status.get("file_path")
-    if not file_path or not Path(file_path).exists():
+    try:
+        file_stat = os.stat(file_path) if file_path else None
+    except OSError:
+        file_stat = None
+
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
         raise HTTPException(status_code=404, detail="Report file not found")
 
+    path = Path(file_path)
+
+    # Passing the stat result saves FileResponse a second stat() call; it
+    # also derives the ETag and Last-Modified headers from it
     return FileResponse(
-        path=file_path,
-        filename=Path(file_path).name,
-        media_type="application/octet-stream",
+        path=path,
+        filename=path.name,
+        stat_result=file_stat,
+        media_type=_MEDIA_TYPES.get(path.suffix, "application/octet-stream"),
+        headers={"Cache-Control": "private, max-age=60"},
     )
 
 
-async def generate_report_task(report_id: str, request: ReportGenerationRequest):
+async def generate_report_task(
+    report_id: str,
+    request: ReportGenerationRequest,
+    store: ReportStatusStore,
+    http_client: httpx.AsyncClient,
+):
     """Background task for report generation.
 
     Args:
         report_id: Report ID
         request: Report generation parameters
+        store: Report status store
+        http_client: Application-scoped HTTP client shared by the API clients
     """
+    # Report generation pulls in polars, openpyxl and jinja2; import it only
+    # when a report is actually requested
+    from ....infrastructure.api_clients import ClockifyClient, AzureDevOpsClient
+    from ....infrastructure.repositories import (
+        ClockifyTimeEntryRepository,
+        AzureDevOpsWorkItemRepository,
+    )
+    from ....infrastructure.adapters import (
+        ExcelReportGenerator,
+        HTMLReportGenerator,
+        LocalCacheService,
+    )
+    from ....domain.value_objects import DateRange
+    from ....domain.services import MatchingService
+    from ....application.use_cases import GenerateReportUseCase
+    from ....application.use_cases.generate_report_use_case import (
+        GenerateReportRequest,
+        ReportFormat,
+    )
+
     settings = get_settings()
 
     try:
         # Update status
-        report_status_store[report_id]["status"] = "processing"
-        report_status_store[report_id]["message"] = "Initializing..."
-        report_status_store[report_id]["progress"] = 0.1
+        await store.update(
+            report_id, status="processing", message="Initializing...", progress=0.1
+        )
 
         # Broadcast via WebSocket
         await ws_manager.send_status_update(report_id, "processing", "Initializing...")
         await ws_manager.send_progress_update(report_id, 0.1, "Initializing...")
 
-        # Parse dates
+        # Dates were already parsed when the request was validated
         if request.start_date:
-            start = datetime.strptime(request.start_date, "%Y-%m-%d")
+            start = datetime.combine(request.start_date, time.min)
         else:
             start = datetime.now() - timedelta(days=7)
 
         if request.end_date:
-            end = datetime.strptime(request.end_date, "%Y-%m-%d")
+            end = datetime.combine(request.end_date, time.min)
         else:
             end = datetime.now()
 
         date_range = DateRange(start, end)
 
         # Initialize clients
-        report_status_store[report_id]["message"] = "Connecting to services..."
-        report_status_store[report_id]["progress"] = 0.2
+        await store.update(report_id, message="Connecting to services...", progress=0.2)
 
         await ws_manager.send_progress_update(
             report_id, 0.2, "Connecting to services..."
         )
 
-        clockify_client = ClockifyClient(settings)
-        ado_client = AzureDevOpsClient(settings)
+        clockify_client = ClockifyClient(settings, http_client=http_client)
+        ado_client = AzureDevOpsClient(settings, http_client=http_client)
 
         # Create repositories
         time_entry_repo = ClockifyTimeEntryRepository(clockify_client)
@@ -220,8 +352,6 @@ async def generate_report_task(report_id: str, request: ReportGenerationRequest)
         # Create cache service
         cache_service = None
         if settings.enable_caching:
-            from ....infrastructure.adapters import LocalCacheService
-
             cache_service = LocalCacheService(settings.cache_directory)
 
         # Create use case
@@ -234,14 +364,13 @@ async def generate_report_task(report_id: str, request: ReportGenerationRequest)
         )
 
         # Generate report
-        report_status_store[report_id]["message"] = "Generating report..."
-        report_status_store[report_id]["progress"] = 0.5
+        await store.update(report_id, message="Generating report...", progress=0.5)
 
         await ws_manager.send_progress_update(report_id, 0.5, "Generating report...")
 
+        extension = _FILE_EXTENSIONS.get(request.format, request.format)
         output_path = (
-            Path(settings.report_output_directory)
-            / f"report_{report_id}.{request.format}"
+            Path(settings.report_output_directory) / f"report_{report_id}.{extension}"
         )
 
         use_case_request = GenerateReportRequest(
@@ -252,6 +381,7 @@ async def generate_report_task(report_id: str, request: ReportGenerationRequest)
             project_ids=request.project_ids,
             include_unmatched=request.include_unmatched,
             group_by=["user", "work_item"],
+            use_cache=request.use_cache,
         )
 
         response = await use_case.execute(use_case_request)
@@ -261,18 +391,22 @@ async def generate_report_task(report_id: str, request: ReportGenerationRequest)
         await ado_client.close()
 
         if response.success:
-            report_status_store[report_id]["status"] = "completed"
-            report_status_store[report_id]["message"] = "Report generated successfully"
-            report_status_store[report_id]["progress"] = 1.0
-            report_status_store[report_id]["file_path"] = str(response.report_path)
+            await store.update(
+                report_id,
+                status="completed",
+                message="Report generated successfully",
+                progress=1.0,
+                file_path=str(response.report_path),
+            )
 
             # Broadcast completion via WebSocket
             await ws_manager.send_completion_update(
                 report_id, f"/api/reports/download/{report_id}"
             )
         else:
-            report_status_store[report_id]["status"] = "failed"
-            report_status_store[report_id]["error"] = "; ".join(response.errors)
+            await store.update(
+                report_id, status="failed", error="; ".join(response.errors)
+            )
 
             # Broadcast failure via WebSocket
             await ws_manager.send_status_update(
@@ -280,8 +414,7 @@ async def generate_report_task(report_id: str, request: ReportGenerationRequest)
             )
 
     except Exception as e:
-        report_status_store[report_id]["status"] = "failed"
-        report_status_store[report_id]["error"] = str(e)
+        await store.update(report_id, status="failed", error=str(e))
 
         # Broadcast failure via WebSocket
         await ws_manager.send_status_update(report_id, "failed", error=str(e))
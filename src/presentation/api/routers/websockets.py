@@ -1,15 +1,17 @@
 """WebSocket endpoints for real-time updates."""
 
 import logging
+
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from ..middleware import WebSocketManager
+from ..middleware.websocket_manager import ws_manager
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# WebSocket manager instance
-ws_manager = WebSocketManager()
+# Heartbeat reply, encoded once
+_PONG = orjson.dumps({"type": "pong", "message": "Connection alive"}).decode()
 
 
 @router.websocket("/ws")
@@ -25,12 +27,10 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             # Keep connection alive and listen for client messages
             data = await websocket.receive_text()
-            logger.debug(f"Received message: {data}")
+            logger.debug("Received message: %s", data)
 
             # Echo back for heartbeat
-            await ws_manager.send_personal_message(
-                {"type": "pong", "message": "Connection alive"}, websocket
-            )
+            await ws_manager.send_personal_text(_PONG, websocket)
 
     except WebSocketDisconnect:
         ws_manager.disconnect(websocket)
@@ -41,6 +41,9 @@ async def websocket_endpoint(websocket: WebSocket):
 async def report_websocket_endpoint(websocket: WebSocket, report_id: str):
     """WebSocket endpoint for specific report updates.
 
+    This is the preferred way to follow a report: every status and
+    progress change is pushed as it happens.
+
     Args:
         websocket: WebSocket connection
         report_id: Report ID to subscribe to
@@ -58,10 +61,28 @@ async def report_websocket_endpoint(websocket: WebSocket, report_id: str):
             websocket,
         )
 
+        # Updates sent before the client subscribed are not replayed, so
+        # start it off with the current status
+        status = await websocket.app.state.report_status_store.get(report_id)
+        if status is not None:
+            snapshot = {
+                "type": "status",
+                "report_id": report_id,
+                "status": status["status"],
+                "progress": status.get("progress"),
+                "message": status.get("message"),
+            }
+            if status["status"] == "completed":
+                snapshot["download_url"] = f"/api/reports/download/{report_id}"
+            elif status["status"] == "failed":
+                snapshot["error"] = status.get("error")
+
+            await ws_manager.send_personal_message(snapshot, websocket)
+
         while True:
             # Keep connection alive and listen for client messages
             data = await websocket.receive_text()
-            logger.debug(f"Received message for report {report_id}: {data}")
+            logger.debug("Received message for report %s: %s", report_id, data)
 
     except WebSocketDisconnect:
         ws_manager.disconnect(websocket, report_id)
@@ -1,5 +1,6 @@
 """Report-related API schemas."""
 
+from datetime import date
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
@@ -7,10 +8,10 @@ from pydantic import BaseModel, Field
 class ReportGenerationRequest(BaseModel):
     """Request model for report generation."""
 
-    start_date: Optional[str] = Field(
+    start_date: Optional[date] = Field(
         None, description="Start date in YYYY-MM-DD format. Default: 7 days ago"
     )
-    end_date: Optional[str] = Field(
+    end_date: Optional[date] = Field(
         None, description="End date in YYYY-MM-DD format. Default: today"
     )
     format: str = Field("excel", description="Output format: excel, html, json")
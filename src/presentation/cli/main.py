@@ -1,9 +1,11 @@
 """Main CLI application using Typer."""
 
 import asyncio
+import atexit
+import os
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import TYPE_CHECKING, Any, Coroutine, Optional, List, Tuple
 import logging
 from enum import Enum
 
@@ -11,17 +13,14 @@ import typer
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.logging import RichHandler
-
-from ...infrastructure.config import get_settings
-from ...infrastructure.api_clients import ClockifyClient, AzureDevOpsClient
-from ...domain.value_objects import DateRange
-from ...domain.services import MatchingService
-from ...application.use_cases import GenerateReportUseCase
-from ...application.use_cases.generate_report_use_case import (
-    GenerateReportRequest,
-    ReportFormat,
-)
+
+from ...infrastructure.config import Settings, get_settings
+
+# API clients, domain services and use cases are imported inside the
+# commands that need them, so `version` and `cache` start quickly
+if TYPE_CHECKING:
+    from ...domain.value_objects import DateRange
+    from ...application.use_cases.generate_report_use_case import ReportFormat
 
 # Set up rich console for better output
 console = Console()
@@ -34,15 +33,11 @@ app = typer.Typer(
     rich_markup_mode="rich",
 )
 
-# Configure logging with Rich
-logging.basicConfig(
-    level="INFO",
-    format="%(message)s",
-    handlers=[RichHandler(console=console, rich_tracebacks=True)],
-)
-
 logger = logging.getLogger(__name__)
 
+# Event loop shared by the commands run in this process
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
 
 class OutputFormat(str, Enum):
     """Output format options."""
@@ -54,7 +49,19 @@ class OutputFormat(str, Enum):
 
 
 def setup_logging(verbose: bool = False, quiet: bool = False):
-    """Set up logging based on verbosity."""
+    """Set up logging based on verbosity.
+
+    Rich logging is configured here, when a command runs, rather than at
+    import, so `--help` and `version` skip Rich's traceback setup.
+    """
+    if not logging.getLogger().handlers:
+        from rich.logging import RichHandler
+
+        logging.basicConfig(
+            format="%(message)s",
+            handlers=[RichHandler(console=console, rich_tracebacks=True)],
+        )
+
     if quiet:
         logging.getLogger().setLevel(logging.ERROR)
     elif verbose:
@@ -63,6 +70,92 @@ def setup_logging(verbose: bool = False, quiet: bool = False):
         logging.getLogger().setLevel(logging.INFO)
 
 
+def _run(coro: Coroutine) -> Any:
+    """Run a coroutine to completion on the CLI's event loop.
+
+    The loop is created on first use and reused by later calls in the same
+    process (e.g. several commands invoked from a script or tests) instead
+    of building a new loop each time, as asyncio.run does.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    global _loop
+
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        atexit.register(_close_loop, _loop)
+
+    return _loop.run_until_complete(coro)
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Finalize async generators and close the event loop at exit.
+
+    Args:
+        loop: Event loop created by _run
+    """
+    if not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _parse_date_option(value: str, option: str) -> datetime:
+    """Parse a YYYY-MM-DD command line date.
+
+    Args:
+        value: Date string from the command line
+        option: Option name, for the error message
+
+    Returns:
+        Datetime at the start of the given day
+
+    Raises:
+        typer.BadParameter: If the value is not an ISO date
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise typer.BadParameter(
+            f"expected a date as YYYY-MM-DD, got {value!r}", param_hint=option
+        )
+
+
+def _status_table(
+    title: str,
+    name_column: str,
+    rows: List[Tuple[str, bool]],
+    ok_label: str,
+    failed_label: str,
+) -> Table:
+    """Build a two-column table of pass/fail checks.
+
+    Args:
+        title: Table title
+        name_column: Header for the column of check names
+        rows: (name, passed) pairs
+        ok_label: Status shown for passed checks
+        failed_label: Status shown for failed checks
+
+    Returns:
+        Table ready to print
+    """
+    table = Table(title=title)
+    table.add_column(name_column, style="cyan")
+    table.add_column("Status", style="green")
+
+    for name, ok in rows:
+        if ok:
+            table.add_row(name, f"[green]{ok_label}[/green]")
+        else:
+            table.add_row(name, f"[red]{failed_label}[/red]")
+
+    return table
+
+
 @app.command()
 def run(
     start_date: Optional[str] = typer.Option(
@@ -95,16 +188,20 @@ def run(
     This command fetches time entries from Clockify, matches them to Azure DevOps
     work items, and generates a comprehensive report.
     """
+    from ...domain.value_objects import DateRange
+    from ...application.use_cases.generate_report_use_case import ReportFormat
+
     setup_logging(verbose, quiet)
+    settings = get_settings()
 
     # Parse dates
     if start_date:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
+        start = _parse_date_option(start_date, "--start")
     else:
         start = datetime.now() - timedelta(days=7)
 
     if end_date:
-        end = datetime.strptime(end_date, "%Y-%m-%d")
+        end = _parse_date_option(end_date, "--end")
     else:
         end = datetime.now()
 
@@ -116,8 +213,9 @@ def run(
     )
 
     # Run async report generation
-    asyncio.run(
+    _run(
         generate_report_async(
+            settings=settings,
             date_range=date_range,
             output_path=output,
             format=ReportFormat(format.value),
@@ -129,146 +227,174 @@ def run(
 
 
 async def generate_report_async(
-    date_range: DateRange,
+    settings: Settings,
+    date_range: "DateRange",
     output_path: Path,
-    format: ReportFormat,
+    format: "ReportFormat",
     user_ids: Optional[List[str]] = None,
     project_ids: Optional[List[str]] = None,
     use_cache: bool = True,
 ):
     """Async report generation logic."""
-    settings = get_settings()
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-
-        # Initialize clients
-        task = progress.add_task("Initializing API clients...", total=None)
-
-        clockify_client = ClockifyClient(settings)
-        ado_client = AzureDevOpsClient(settings)
-
-        # Test connections
-        progress.update(task, description="Testing connections...")
-
-        clockify_ok = await clockify_client.test_connection()
-        ado_ok = await ado_client.test_connection()
-
-        if not clockify_ok:
-            console.print("[bold red]Failed to connect to Clockify API[/bold red]")
-            raise typer.Exit(1)
+    import httpx
+
+    from ...infrastructure.api_clients import ClockifyClient, AzureDevOpsClient
+    from ...infrastructure.api_clients.base_client import HTTP2_AVAILABLE
+    from ...domain.services import MatchingService
+    from ...application.use_cases import GenerateReportUseCase
+    from ...application.use_cases.generate_report_use_case import (
+        GenerateReportRequest,
+    )
 
-        if not ado_ok:
-            console.print("[bold red]Failed to connect to Azure DevOps API[/bold red]")
-            raise typer.Exit(1)
+    # One connection pool for both APIs, kept alive for the whole report
+    async with httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    ) as http_client:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
 
-        progress.update(task, description="Connections verified ✓")
+            # Initialize clients
+            task = progress.add_task("Initializing API clients...", total=None)
 
-        # Import repository implementations
-        from ...infrastructure.repositories import (
-            ClockifyTimeEntryRepository,
-            AzureDevOpsWorkItemRepository,
-        )
+            clockify_client = ClockifyClient(settings, http_client=http_client)
+            ado_client = AzureDevOpsClient(settings, http_client=http_client)
 
-        # Create repositories
-        time_entry_repo = ClockifyTimeEntryRepository(clockify_client)
-        work_item_repo = AzureDevOpsWorkItemRepository(ado_client)
+            # Test connections
+            progress.update(task, description="Testing connections...")
 
-        # Create services
-        matching_service = MatchingService()
+            clockify_ok, ado_ok = await asyncio.gather(
+                clockify_client.test_connection(), ado_client.test_connection()
+            )
 
-        # Import report generator
-        from ...infrastructure.adapters import ExcelReportGenerator
+            if not clockify_ok:
+                console.print("[bold red]Failed to connect to Clockify API[/bold red]")
+                raise typer.Exit(1)
 
-        report_generator = ExcelReportGenerator()
+            if not ado_ok:
+                console.print(
+                    "[bold red]Failed to connect to Azure DevOps API[/bold red]"
+                )
+                raise typer.Exit(1)
 
-        # Create cache service if enabled
-        cache_service = None
-        if use_cache and settings.enable_caching:
-            from ...infrastructure.adapters import LocalCacheService
+            progress.update(task, description="Connections verified ✓")
 
-            cache_service = LocalCacheService(settings.cache_directory)
+            # Import repository implementations
+            from ...infrastructure.repositories import (
+                ClockifyTimeEntryRepository,
+                AzureDevOpsWorkItemRepository,
+            )
 
-        # Create use case
-        use_case = GenerateReportUseCase(
-            time_entry_repo=time_entry_repo,
-            work_item_repo=work_item_repo,
-            matching_service=matching_service,
-            report_generator=report_generator,
-            cache_service=cache_service,
-        )
+            # Create repositories
+            time_entry_repo = ClockifyTimeEntryRepository(clockify_client)
+            work_item_repo = AzureDevOpsWorkItemRepository(ado_client)
 
-        # Create request
-        request = GenerateReportRequest(
-            date_range=date_range,
-            format=format,
-            output_path=output_path,
-            user_ids=user_ids,
-            project_ids=project_ids,
-            include_unmatched=True,
-            group_by=["user", "work_item"],
-        )
+            # Create services
+            matching_service = MatchingService()
 
-        # Execute use case
-        progress.update(task, description="Generating report...")
+            # Import report generator
+            from ...infrastructure.adapters import ExcelReportGenerator
 
-        try:
-            response = await use_case.execute(request)
+            report_generator = ExcelReportGenerator()
 
-            if response.success:
-                # Display results
-                console.print(
-                    "\n[bold green]✓ Report generated successfully![/bold green]\n"
-                )
+            # Create cache service if enabled
+            cache_service = None
+            if use_cache and settings.enable_caching:
+                from ...infrastructure.adapters import LocalCacheService
 
-                # Create summary table
-                table = Table(title="Report Summary")
-                table.add_column("Metric", style="cyan")
-                table.add_column("Value", style="green")
+                cache_service = LocalCacheService(settings.cache_directory)
 
-                table.add_row("Output File", str(response.report_path))
-                table.add_row("Total Entries", str(response.total_entries))
-                table.add_row(
-                    "Matched Entries",
-                    f"{response.matched_entries} ({response.matched_entries/response.total_entries*100:.1f}%)",
-                )
-                table.add_row("Unmatched Entries", str(response.unmatched_entries))
-                table.add_row("Total Hours", f"{response.total_hours:.1f}")
-
-                console.print(table)
-
-                # Display warnings if any
-                if response.warnings:
-                    console.print("\n[yellow]⚠ Warnings:[/yellow]")
-                    for warning in response.warnings:
-                        console.print(f"  • {warning}")
+            # Create use case
+            use_case = GenerateReportUseCase(
+                time_entry_repo=time_entry_repo,
+                work_item_repo=work_item_repo,
+                matching_service=matching_service,
+                report_generator=report_generator,
+                cache_service=cache_service,
+            )
 
-            else:
-                console.print("\n[bold red]✗ Report generation failed![/bold red]\n")
+            # Create request
+            request = GenerateReportRequest(
+                date_range=date_range,
+                format=format,
+                output_path=output_path,
+                user_ids=user_ids,
+                project_ids=project_ids,
+                include_unmatched=True,
+                group_by=["user", "work_item"],
+            )
 
-                if response.errors:
-                    console.print("[red]Errors:[/red]")
-                    for error in response.errors:
-                        console.print(f"  • {error}")
+            # Execute use case
+            progress.update(task, description="Generating report...")
 
+            try:
+                response = await use_case.execute(request)
+
+                if response.success:
+                    # Display results
+                    console.print(
+                        "\n[bold green]✓ Report generated successfully![/bold green]\n"
+                    )
+
+                    # Create summary table
+                    table = Table(title="Report Summary")
+                    table.add_column("Metric", style="cyan")
+                    table.add_column("Value", style="green")
+
+                    table.add_row("Output File", str(response.report_path))
+                    table.add_row("Total Entries", str(response.total_entries))
+                    # An empty date range is a valid, zero-entry report
+                    matched_pct = (
+                        response.matched_entries / response.total_entries * 100
+                        if response.total_entries
+                        else 0.0
+                    )
+                    table.add_row(
+                        "Matched Entries",
+                        f"{response.matched_entries} ({matched_pct:.1f}%)",
+                    )
+                    table.add_row("Unmatched Entries", str(response.unmatched_entries))
+                    table.add_row("Total Hours", f"{response.total_hours:.1f}")
+
+                    console.print(table)
+
+                    # Display warnings if any
+                    if response.warnings:
+                        console.print("\n[yellow]⚠ Warnings:[/yellow]")
+                        console.print(
+                            "\n".join(f"  • {warning}" for warning in response.warnings)
+                        )
+
+                else:
+                    console.print(
+                        "\n[bold red]✗ Report generation failed![/bold red]\n"
+                    )
+
+                    if response.errors:
+                        console.print("[red]Errors:[/red]")
+                        console.print(
+                            "\n".join(f"  • {error}" for error in response.errors)
+                        )
+
+                    raise typer.Exit(1)
+
+            except Exception as e:
+                console.print(f"\n[bold red]Error:[/bold red] {e}")
                 raise typer.Exit(1)
 
-        except Exception as e:
-            console.print(f"\n[bold red]Error:[/bold red] {e}")
-            raise typer.Exit(1)
-
-        finally:
-            # Clean up
-            await clockify_client.close()
-            await ado_client.close()
+            finally:
+                # Clean up
+                await clockify_client.close()
+                await ado_client.close()
 
 
 @app.command()
 def validate():
     """Validate configuration and API connections."""
+    setup_logging()
     console.print("[bold cyan]Validating configuration...[/bold cyan]\n")
 
     try:
@@ -283,20 +409,13 @@ def validate():
             ("Azure DevOps PAT", bool(settings.ado_pat)),
         ]
 
-        table = Table(title="Configuration Status")
-        table.add_column("Setting", style="cyan")
-        table.add_column("Status", style="green")
-
-        all_valid = True
-        for name, is_set in required:
-            status = "✓ Set" if is_set else "✗ Missing"
-            style = "green" if is_set else "red"
-            table.add_row(name, f"[{style}]{status}[/{style}]")
-            all_valid = all_valid and is_set
-
-        console.print(table)
+        console.print(
+            _status_table(
+                "Configuration Status", "Setting", required, "✓ Set", "✗ Missing"
+            )
+        )
 
-        if not all_valid:
+        if not all(is_set for _, is_set in required):
             console.print(
                 "\n[bold red]Configuration incomplete. Please check your .env file.[/bold red]"
             )
@@ -306,35 +425,34 @@ def validate():
         console.print("\n[bold cyan]Testing API connections...[/bold cyan]\n")
 
         async def test_connections():
-            clockify = ClockifyClient(settings)
-            ado = AzureDevOpsClient(settings)
+            import httpx
 
-            try:
-                clockify_ok = await clockify.test_connection()
-                ado_ok = await ado.test_connection()
+            from ...infrastructure.api_clients import (
+                ClockifyClient,
+                AzureDevOpsClient,
+            )
+            from ...infrastructure.api_clients.base_client import HTTP2_AVAILABLE
 
-                return clockify_ok, ado_ok
-            finally:
-                await clockify.close()
-                await ado.close()
+            async with httpx.AsyncClient(http2=HTTP2_AVAILABLE) as http_client:
+                clockify = ClockifyClient(settings, http_client=http_client)
+                ado = AzureDevOpsClient(settings, http_client=http_client)
 
-        clockify_ok, ado_ok = asyncio.run(test_connections())
+                return await asyncio.gather(
+                    clockify.test_connection(), ado.test_connection()
+                )
 
-        connection_table = Table(title="Connection Status")
-        connection_table.add_column("Service", style="cyan")
-        connection_table.add_column("Status", style="green")
+        clockify_ok, ado_ok = _run(test_connections())
 
-        connection_table.add_row(
-            "Clockify API",
-            f"[{'green' if clockify_ok else 'red'}]{'✓ Connected' if clockify_ok else '✗ Failed'}[/]",
-        )
-        connection_table.add_row(
-            "Azure DevOps API",
-            f"[{'green' if ado_ok else 'red'}]{'✓ Connected' if ado_ok else '✗ Failed'}[/]",
+        console.print(
+            _status_table(
+                "Connection Status",
+                "Service",
+                [("Clockify API", clockify_ok), ("Azure DevOps API", ado_ok)],
+                "✓ Connected",
+                "✗ Failed",
+            )
         )
 
-        console.print(connection_table)
-
         if clockify_ok and ado_ok:
             console.print("\n[bold green]✓ All validations passed![/bold green]")
         else:
@@ -351,6 +469,7 @@ def validate():
 @app.command()
 def cache(action: str = typer.Argument(..., help="Action to perform: clear, stats")):
     """Manage cache."""
+    setup_logging()
     settings = get_settings()
 
     if action == "clear":
@@ -363,7 +482,7 @@ def cache(action: str = typer.Argument(..., help="Action to perform: clear, stat
         async def clear_cache():
             return await cache_service.clear()
 
-        success = asyncio.run(clear_cache())
+        success = _run(clear_cache())
 
         if success:
             console.print("[green]✓ Cache cleared successfully![/green]")
@@ -375,15 +494,22 @@ def cache(action: str = typer.Argument(..., help="Action to perform: clear, stat
 
         cache_dir = settings.cache_directory
         if cache_dir.exists():
-            files = list(cache_dir.glob("*.cache"))
-            total_size = sum(f.stat().st_size for f in files)
+            # Single pass; DirEntry.is_file() uses the type from the
+            # directory listing, so only stat() costs a system call
+            file_count = 0
+            total_size = 0
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".cache") and entry.is_file():
+                        file_count += 1
+                        total_size += entry.stat().st_size
 
             table = Table(title="Cache Statistics")
             table.add_column("Metric", style="cyan")
             table.add_column("Value", style="green")
 
             table.add_row("Cache Directory", str(cache_dir))
-            table.add_row("Number of Files", str(len(files)))
+            table.add_row("Number of Files", str(file_count))
             table.add_row("Total Size", f"{total_size / 1024:.1f} KB")
 
             console.print(table)
@@ -0,0 +1,125 @@
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from src.application.use_cases.generate_report_use_case import (
+        GenerateReportRequest,
+        GenerateReportUseCase,
+        ReportFormat,
+    )
+    from src.domain.value_objects import DateRange
+except ImportError as e:
+    pytest.skip(f"use case dependencies unavailable: {e}", allow_module_level=True)
+
+
+def _entry():
+    return SimpleNamespace(
+        description=None,
+        duration=SimpleNamespace(hours=1.5),
+        to_dict=lambda: {"hours": 1.5},
+    )
+
+
+class FakeTimeEntryRepository:
+    """Returns one unmatched entry per query and counts the queries."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_by_date_range(self, date_range):
+        self.calls += 1
+        return [_entry()]
+
+    async def get_by_user(self, user_id, date_range):
+        self.calls += 1
+        return [_entry()]
+
+
+class FakeMatchingService:
+    def match_time_entries_to_work_items(self, time_entries, work_items):
+        return [
+            SimpleNamespace(time_entry=entry, is_matched=False)
+            for entry in time_entries
+        ]
+
+    def get_match_statistics(self, results):
+        return {
+            "match_rate": 0.0,
+            "matched_entries": 0,
+            "unmatched_entries": len(results),
+        }
+
+
+class FakeReportGenerator:
+    async def generate(self, data, format, output_path=None, options=None):
+        return Path("report.xlsx")
+
+
+@pytest.fixture
+def entries():
+    return FakeTimeEntryRepository()
+
+
+@pytest.fixture
+def use_case(entries, cache):
+    return GenerateReportUseCase(
+        time_entry_repo=entries,
+        work_item_repo=None,
+        matching_service=FakeMatchingService(),
+        report_generator=FakeReportGenerator(),
+        cache_service=cache,
+    )
+
+
+def _request(end=datetime(2024, 3, 7), **kwargs):
+    return GenerateReportRequest(
+        date_range=DateRange(datetime(2024, 3, 1), end),
+        format=ReportFormat.EXCEL,
+        **kwargs,
+    )
+
+
+class TestReportDataCache:
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(self, use_case, entries):
+        first = await use_case.execute(_request())
+        second = await use_case.execute(_request())
+
+        assert first.success and second.success
+        assert second.total_entries == first.total_entries == 1
+        assert second.total_hours == 1.5
+        assert entries.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_different_times_on_same_day_fetched_separately(
+        self, use_case, entries
+    ):
+        await use_case.execute(_request(datetime(2024, 3, 7)))
+        await use_case.execute(_request(datetime(2024, 3, 7, 9, 15, 2)))
+        await use_case.execute(_request(datetime(2024, 3, 7, 18, 40, 51)))
+
+        assert entries.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_user_order_does_not_matter(self, use_case, entries):
+        await use_case.execute(_request(user_ids=["b", "a"]))
+        await use_case.execute(_request(user_ids=["a", "b"]))
+
+        assert entries.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_refetches_and_refreshes(
+        self, use_case, entries, cache
+    ):
+        await use_case.execute(_request())
+        cache.reads.clear()
+
+        await use_case.execute(_request(use_cache=False))
+        assert cache.reads == []
+        assert entries.calls == 2
+
+        await use_case.execute(_request())
+        assert entries.calls == 2
@@ -0,0 +1,47 @@
+"""Shared fixtures for unit tests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeClock:
+    """Stand-in for time.monotonic; advance it by adding to ``now``."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeCache:
+    """In-memory CacheService that records the keys it is asked for."""
+
+    def __init__(self):
+        self.data = {}
+        self.reads = []
+
+    async def get(self, key):
+        self.reads.append(key)
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+
+
+@pytest.fixture
+def freeze_clock(monkeypatch):
+    """Replace a module's monotonic clock with a FakeClock it returns."""
+
+    def freeze(module):
+        clock = FakeClock()
+        monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=clock))
+        return clock
+
+    return freeze
+
+
+@pytest.fixture
+def cache():
+    return FakeCache()
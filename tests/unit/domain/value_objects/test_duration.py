@@ -35,6 +35,12 @@ class TestDuration:
         with pytest.raises(ValueError):
             Duration.from_iso8601("invalid")
 
+    def test_iso8601_repeated_parse(self):
+        assert Duration.from_iso8601("PT2H") == Duration.from_iso8601("PT2H")
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                Duration.from_iso8601("invalid")
+
     def test_negative_duration(self):
         with pytest.raises(ValueError, match="cannot be negative"):
             Duration.from_seconds(-1)
@@ -24,6 +24,14 @@ class TestWorkItemId:
         with pytest.raises(ValueError, match="too large"):
             WorkItemId(1000000)
 
+    def test_equal_ids_share_instance(self):
+        wi_id = WorkItemId(4321)
+        assert WorkItemId(4321) is wi_id
+        assert WorkItemId.from_string("4321") is wi_id
+        with pytest.raises(TypeError):
+            WorkItemId(4321.0)
+        assert wi_id.value == 4321
+
     def test_from_string_valid(self):
         wi_id = WorkItemId.from_string("12345")
         assert wi_id is not None
@@ -0,0 +1,124 @@
+import pytest
+
+try:
+    from src.infrastructure.adapters import report_status_stores as stores
+except ImportError as e:
+    pytest.skip(f"adapter dependencies unavailable: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def clock(freeze_clock):
+    return freeze_clock(stores)
+
+
+class TestInMemoryReportStatusStore:
+    @pytest.mark.asyncio
+    async def test_unknown_report(self):
+        store = stores.InMemoryReportStatusStore()
+        assert await store.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_returns_none(self, clock):
+        store = stores.InMemoryReportStatusStore(ttl=60)
+        await store.update("r1", status="pending")
+
+        clock.now += 59
+        assert await store.get("r1") == {"status": "pending"}
+
+        clock.now += 1
+        assert await store.get("r1") is None
+
+    @pytest.mark.asyncio
+    async def test_update_refreshes_expiry(self, clock):
+        store = stores.InMemoryReportStatusStore(ttl=60)
+        await store.update("r1", status="pending")
+
+        clock.now += 50
+        await store.update("r1", progress=10)
+        clock.now += 50
+
+        assert await store.get("r1") is not None
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_starts_fresh(self, clock):
+        store = stores.InMemoryReportStatusStore(ttl=60)
+        await store.update("r1", status="pending", progress=0)
+
+        clock.now += 60
+        await store.get("r1")
+        await store.update("r1", progress=10)
+
+        assert await store.get("r1") == {"progress": 10}
+
+    @pytest.mark.asyncio
+    async def test_oldest_report_evicted_over_cap(self):
+        store = stores.InMemoryReportStatusStore(max_reports=2)
+        for report_id in ("r1", "r2", "r3"):
+            await store.update(report_id, status="pending")
+
+        assert await store.get("r1") is None
+        assert await store.get("r2") is not None
+        assert await store.get("r3") is not None
+
+    @pytest.mark.asyncio
+    async def test_recently_updated_report_not_evicted(self):
+        store = stores.InMemoryReportStatusStore(max_reports=2)
+        await store.update("r1", status="pending")
+        await store.update("r2", status="pending")
+        await store.update("r1", progress=50)
+        await store.update("r3", status="pending")
+
+        assert await store.get("r1") is not None
+        assert await store.get("r2") is None
+
+    @pytest.mark.asyncio
+    async def test_partial_update_merges(self):
+        store = stores.InMemoryReportStatusStore()
+        await store.update("r1", status="processing", progress=0)
+        await store.update("r1", progress=40)
+
+        assert await store.get("r1") == {"status": "processing", "progress": 40}
+
+    @pytest.mark.asyncio
+    async def test_get_returns_copy(self):
+        store = stores.InMemoryReportStatusStore()
+        await store.update("r1", status="pending")
+
+        (await store.get("r1"))["status"] = "tampered"
+
+        assert await store.get("r1") == {"status": "pending"}
+
+
+class TestInMemoryPollRateLimit:
+    @pytest.mark.asyncio
+    async def test_unknown_report_allowed(self):
+        store = stores.InMemoryReportStatusStore()
+        assert await store.try_acquire_poll("missing", 1) is True
+
+    @pytest.mark.asyncio
+    async def test_second_poll_within_interval_refused(self, clock):
+        store = stores.InMemoryReportStatusStore()
+        await store.update("r1", status="pending")
+
+        assert await store.try_acquire_poll("r1", 1) is True
+        clock.now += 0.5
+        assert await store.try_acquire_poll("r1", 1) is False
+
+    @pytest.mark.asyncio
+    async def test_poll_after_interval_allowed(self, clock):
+        store = stores.InMemoryReportStatusStore()
+        await store.update("r1", status="pending")
+
+        assert await store.try_acquire_poll("r1", 1) is True
+        clock.now += 1
+        assert await store.try_acquire_poll("r1", 1) is True
+        assert await store.try_acquire_poll("r1", 1) is False
+
+    @pytest.mark.asyncio
+    async def test_polls_limited_per_report(self, clock):
+        store = stores.InMemoryReportStatusStore()
+        await store.update("r1", status="pending")
+        await store.update("r2", status="pending")
+
+        assert await store.try_acquire_poll("r1", 1) is True
+        assert await store.try_acquire_poll("r2", 1) is True
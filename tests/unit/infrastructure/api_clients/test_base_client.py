@@ -0,0 +1,93 @@
+import pytest
+
+pytest.importorskip("httpx")
+
+try:
+    from src.infrastructure.api_clients.base_client import BaseAPIClient
+except ImportError as e:
+    pytest.skip(f"client dependencies unavailable: {e}", allow_module_level=True)
+
+
+class CannedPagesClient(BaseAPIClient):
+    """Serves canned pages by page number instead of calling an API."""
+
+    def __init__(self, pages):
+        super().__init__("https://example.test", {})
+        self.pages = pages
+        self.requested = []
+
+    async def get(self, endpoint, params=None, headers=None):
+        page = params["page"]
+        self.requested.append(page)
+        return {"items": self.pages.get(page, [])}
+
+    def _extract_items_from_response(self, response):
+        return response["items"]
+
+
+def _pages(*sizes):
+    """Build pages of sequentially numbered items with the given sizes."""
+    pages, next_item = {}, 0
+    for page, size in enumerate(sizes, start=1):
+        pages[page] = list(range(next_item, next_item + size))
+        next_item += size
+    return pages
+
+
+async def _paginate(client, **kwargs):
+    return await client.get_paginated("items", page_size=2, **kwargs)
+
+
+class TestGetPaginated:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 2, 3, 5])
+    async def test_short_page_exit(self, concurrency):
+        client = CannedPagesClient(_pages(2, 2, 2, 1))
+
+        items = await _paginate(client, concurrency=concurrency)
+
+        assert items == list(range(7))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 2, 3])
+    async def test_empty_page_exit(self, concurrency):
+        client = CannedPagesClient(_pages(2, 2))
+
+        items = await _paginate(client, concurrency=concurrency)
+
+        assert items == list(range(4))
+        assert 3 in client.requested
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 2, 3, 5])
+    async def test_max_pages_exit(self, concurrency):
+        client = CannedPagesClient(_pages(2, 2, 2, 2, 2, 2))
+
+        items = await _paginate(client, concurrency=concurrency, max_pages=4)
+
+        assert items == list(range(8))
+        assert max(client.requested) == 4
+
+    @pytest.mark.asyncio
+    async def test_short_page_mid_window_ignores_later_pages(self):
+        # Page 2 is short, but a misbehaving API still returns a full page 3
+        # in the same window
+        pages = _pages(2, 1)
+        pages[3] = [100, 101]
+        client = CannedPagesClient(pages)
+
+        items = await _paginate(client, concurrency=3)
+
+        assert sorted(client.requested) == [1, 2, 3]
+        assert items == [0, 1, 2]
+        assert len(items) == len(set(items))
+
+    @pytest.mark.asyncio
+    async def test_windows_request_each_page_once(self):
+        client = CannedPagesClient(_pages(2, 2, 2, 2, 2, 1))
+
+        items = await _paginate(client, concurrency=4)
+
+        assert items == list(range(11))
+        assert sorted(client.requested) == list(range(1, 9))
+        assert len(client.requested) == len(set(client.requested))
@@ -0,0 +1,171 @@
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from src.infrastructure.repositories import (
+        azure_devops_work_item_repository as repo,
+    )
+except ImportError as e:
+    pytest.skip(f"repository dependencies unavailable: {e}", allow_module_level=True)
+
+from src.domain.entities.work_item import WorkItemState
+from src.domain.value_objects import WorkItemId
+
+HOSTILE = "x' OR [System.Id] > 0 OR 'a' = 'a"
+
+
+class FakeClient:
+    """Azure DevOps client that serves one work item per requested ID."""
+
+    def __init__(self):
+        self.queries = []
+        self.fetched = []
+
+    async def get_work_items_by_query(self, wiql):
+        self.queries.append(wiql)
+        return [SimpleNamespace(id=WorkItemId(len(self.queries)))]
+
+    async def get_work_items_by_ids(self, work_item_ids):
+        ids = sorted(int(work_item_id) for work_item_id in work_item_ids)
+        self.fetched.extend(ids)
+        return [SimpleNamespace(id=WorkItemId(i)) for i in ids]
+
+
+@pytest.fixture
+def clock(freeze_clock):
+    return freeze_clock(repo)
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+def _ids(*values):
+    return {WorkItemId(value) for value in values}
+
+
+class TestWiqlQueries:
+    @pytest.mark.asyncio
+    async def test_quotes_escaped(self, client):
+        repository = repo.AzureDevOpsWorkItemRepository(client)
+
+        await repository.get_by_assigned_to("O'Brien")
+
+        assert "[System.AssignedTo] = 'O''Brien'" in client.queries[0]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("assignee", ["@me", " @ME "])
+    async def test_me_macro(self, client, assignee):
+        repository = repo.AzureDevOpsWorkItemRepository(client)
+
+        await repository.get_by_assigned_to(assignee)
+
+        assert "[System.AssignedTo] = @Me " in client.queries[0]
+
+    @pytest.mark.asyncio
+    async def test_no_state_clause_without_states(self, client):
+        repository = repo.AzureDevOpsWorkItemRepository(client)
+
+        await repository.get_by_area("Project\\Team")
+
+        assert "[System.State]" not in client.queries[0]
+
+    @pytest.mark.asyncio
+    async def test_states_deduplicated_and_ordered(self, client):
+        repository = repo.AzureDevOpsWorkItemRepository(client)
+
+        await repository.get_by_area(
+            "Project", [WorkItemState.NEW, WorkItemState.ACTIVE, WorkItemState.NEW]
+        )
+        await repository.get_by_area(
+            "Project", [WorkItemState.ACTIVE, WorkItemState.NEW]
+        )
+
+        assert client.queries[0].endswith(" AND [System.State] IN ('Active', 'New')")
+        # Both spell the same query, so the second is served from the cache
+        assert len(client.queries) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method", ["get_by_area", "get_by_assigned_to", "search_by_title"]
+    )
+    async def test_queries_never_contain_raw_input(self, client, method):
+        repository = repo.AzureDevOpsWorkItemRepository(client)
+
+        await getattr(repository, method)(HOSTILE, [WorkItemState.ACTIVE])
+
+        wiql = client.queries[0]
+        assert "[System.TeamProject] = @Project" in wiql
+        assert "'x'' OR [System.Id] > 0 OR ''a'' = ''a'" in wiql
+        assert HOSTILE not in wiql
+        assert wiql.count("'") % 2 == 0
+
+
+class TestQueryCache:
+    @pytest.mark.asyncio
+    async def test_cached_result_reused_before_expiry(self, clock, client):
+        repository = repo.AzureDevOpsWorkItemRepository(client, cache_ttl=60)
+
+        first = await repository.query("SELECT 1")
+        clock.now += 30
+        second = await repository.query("SELECT 1")
+
+        assert len(client.queries) == 1
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_expired_result_refetched(self, clock, client):
+        repository = repo.AzureDevOpsWorkItemRepository(client, cache_ttl=60)
+
+        await repository.query("SELECT 1")
+        clock.now += 60
+        result = await repository.query("SELECT 1")
+
+        assert len(client.queries) == 2
+        assert [int(wi.id) for wi in result] == [2]
+
+    @pytest.mark.asyncio
+    async def test_oldest_result_evicted_over_limit(self, clock, client):
+        repository = repo.AzureDevOpsWorkItemRepository(client, max_cached_queries=2)
+
+        for wiql in ("SELECT 1", "SELECT 2", "SELECT 3", "SELECT 1", "SELECT 3"):
+            await repository.query(wiql)
+
+        assert len(client.queries) == 4
+
+
+class TestItemCache:
+    @pytest.mark.asyncio
+    async def test_cached_items_reused_before_expiry(self, clock, client):
+        repository = repo.AzureDevOpsWorkItemRepository(client, cache_ttl=60)
+
+        await repository.get_by_ids(_ids(1, 2))
+        clock.now += 30
+        items = await repository.get_by_ids(_ids(1, 2, 3))
+
+        assert client.fetched == [1, 2, 3]
+        assert sorted(int(wi.id) for wi in items) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_expired_item_refetched(self, clock, client):
+        repository = repo.AzureDevOpsWorkItemRepository(client, cache_ttl=60)
+
+        await repository.get_by_ids(_ids(1))
+        clock.now += 60
+        await repository.get_by_ids(_ids(2))
+        items = await repository.get_by_ids(_ids(1, 2))
+
+        assert client.fetched == [1, 2, 1]
+        assert sorted(int(wi.id) for wi in items) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_oldest_item_evicted_over_limit(self, clock, client):
+        repository = repo.AzureDevOpsWorkItemRepository(client, max_cached_items=2)
+
+        for work_item_id in (1, 2, 3):
+            await repository.get_by_ids(_ids(work_item_id))
+        await repository.get_by_ids(_ids(1, 3))
+
+        assert client.fetched == [1, 2, 3, 1]
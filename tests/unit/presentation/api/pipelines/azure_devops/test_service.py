@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from src.domain.value_objects import WorkItemId
+    from src.presentation.api.pipelines.azure_devops.service import (
+        AzureDevOpsService,
+    )
+except ImportError as e:
+    pytest.skip(f"service dependencies unavailable: {e}", allow_module_level=True)
+
+
+class FakeRepository:
+    """Returns the known work items in descending ID order."""
+
+    def __init__(self, known_ids):
+        self.known_ids = known_ids
+        self.requests = []
+
+    async def get_by_ids(self, work_item_ids):
+        self.requests.append(work_item_ids)
+        return [
+            SimpleNamespace(
+                id=WorkItemId(i),
+                title=f"Item {i}",
+                work_item_type="Task",
+                state="Active",
+                assigned_to=None,
+                created_date=None,
+                changed_date=None,
+            )
+            for i in sorted(self.known_ids, reverse=True)
+            if WorkItemId(i) in work_item_ids
+        ]
+
+
+@pytest.fixture
+def service():
+    service = AzureDevOpsService()
+    service.client = object()
+    service.repository = FakeRepository({11, 12, 13, 14})
+    return service
+
+
+class TestGetWorkItems:
+    @pytest.mark.asyncio
+    async def test_single_repository_call(self, service):
+        await service.get_work_items([11, 12, 13])
+
+        assert service.repository.requests == [
+            {WorkItemId(11), WorkItemId(12), WorkItemId(13)}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_items_in_requested_order(self, service):
+        response = await service.get_work_items([12, 14, 11, 12, 99, 13])
+
+        assert [item.id for item in response.work_items] == [12, 14, 11, 13]
+        assert response.count == 4
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+try:
+    from src.presentation.api.pipelines.github.service import GitHubService
+except ImportError as e:
+    pytest.skip(f"service dependencies unavailable: {e}", allow_module_level=True)
+
+
+REST_ISSUES = {
+    7: {
+        "number": 7,
+        "title": "Fix login",
+        "state": "open",
+        "assignee": {"login": "octocat"},
+        "created_at": "2024-03-01T09:00:00Z",
+        "updated_at": "2024-03-02T10:30:00Z",
+        "labels": [{"name": "bug"}, {"name": "auth"}],
+    },
+    9: {
+        "number": 9,
+        "title": "Update docs",
+        "state": "closed",
+        "assignee": None,
+        "created_at": "2024-03-03T08:00:00Z",
+        "updated_at": "2024-03-04T12:00:00Z",
+        "labels": [],
+    },
+}
+
+GRAPHQL_ISSUES = {
+    7: {
+        "number": 7,
+        "title": "Fix login",
+        "state": "OPEN",
+        "createdAt": "2024-03-01T09:00:00Z",
+        "updatedAt": "2024-03-02T10:30:00Z",
+        "assignees": {"nodes": [{"login": "octocat"}]},
+        "labels": {"nodes": [{"name": "bug"}, {"name": "auth"}]},
+    },
+    9: {
+        "number": 9,
+        "title": "Update docs",
+        "state": "CLOSED",
+        "createdAt": "2024-03-03T08:00:00Z",
+        "updatedAt": "2024-03-04T12:00:00Z",
+        "assignees": {"nodes": []},
+        "labels": {"nodes": []},
+    },
+}
+
+
+@pytest.fixture
+def github():
+    """Fake GitHub API answering REST and GraphQL with the same issues."""
+    graphql_queries = []
+
+    def handler(request):
+        if request.url.path == "/graphql":
+            graphql_queries.append(json.loads(request.content))
+            # Issue 8 does not exist, so its alias comes back null
+            repository = {f"i{n}": GRAPHQL_ISSUES.get(n) for n in (7, 8, 9)}
+            return httpx.Response(200, json={"data": {"repository": repository}})
+
+        number = int(request.url.path.rsplit("/", 1)[1])
+        if number not in REST_ISSUES:
+            return httpx.Response(404, json={"message": "Not Found"})
+        return httpx.Response(200, json=REST_ISSUES[number])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, graphql_queries
+
+
+class TestGetIssuesBatch:
+    @pytest.mark.asyncio
+    async def test_graphql_matches_rest(self, github):
+        client, graphql_queries = github
+
+        rest = await GitHubService(client=client).get_issues_batch(
+            "owner", "repo", [7, 8, 9]
+        )
+        graphql = await GitHubService(token="token", client=client).get_issues_batch(
+            "owner", "repo", [7, 8, 9]
+        )
+
+        assert len(graphql_queries) == 1
+        assert graphql == rest
+
+    @pytest.mark.asyncio
+    async def test_issue_fields(self, github):
+        client, _ = github
+
+        issues = await GitHubService(token="token", client=client).get_issues_batch(
+            "owner", "repo", [7, 8, 9]
+        )
+
+        assert [issue["number"] for issue in issues] == [7, 9]
+        assert issues[0]["state"] == "open"
+        assert issues[0]["assignee"] == "octocat"
+        assert issues[0]["labels"] == ["bug", "auth"]
+        assert issues[1]["state"] == "closed"
+        assert issues[1]["assignee"] is None
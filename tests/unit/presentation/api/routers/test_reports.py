@@ -0,0 +1,54 @@
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+try:
+    from fastapi import FastAPI
+
+    from src.infrastructure.adapters.report_status_stores import (
+        InMemoryReportStatusStore,
+    )
+    from src.presentation.api.routers import reports
+except ImportError as e:
+    pytest.skip(f"router dependencies unavailable: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def store():
+    return InMemoryReportStatusStore()
+
+
+@pytest.fixture
+def client(store):
+    app = FastAPI()
+    app.include_router(reports.router, prefix="/api/reports")
+    app.state.report_status_store = store
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+class TestReportStatus:
+    @pytest.mark.asyncio
+    async def test_unknown_report(self, client):
+        response = await client.get("/api/reports/status/missing")
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_status_returned(self, client, store):
+        await store.update("r1", status="processing", progress=25.0)
+
+        response = await client.get("/api/reports/status/r1")
+
+        assert response.status_code == 200
+        assert response.json()["progress"] == 25.0
+
+    @pytest.mark.asyncio
+    async def test_fast_poll_rejected_with_retry_after(self, client, store):
+        await store.update("r1", status="processing", progress=25.0)
+
+        assert (await client.get("/api/reports/status/r1")).status_code == 200
+        response = await client.get("/api/reports/status/r1")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == str(reports.STATUS_POLL_INTERVAL)
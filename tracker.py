@@ -21,9 +21,10 @@ Configuration:
     - See docs/activity-tracker.md for full configuration options
 """
 
-import time
 import os
+import signal
 import sys
+import threading
 from pathlib import Path
 
 # Add project root to path
@@ -49,19 +50,19 @@ def print_banner():
     print(banner)
 
 
-def check_requirements():
+def check_requirements(enable_activity, enable_github):
     """Check if required packages are installed."""
     issues = []
 
     # Check for activity tracker requirements
-    if os.getenv("ENABLE_ACTIVITY_TRACKER", "false").lower() == "true":
+    if enable_activity:
         try:
             import pynput
         except ImportError:
             issues.append("pynput is not installed. Install with: pip install pynput")
 
     # Check for GitHub tracker requirements
-    if os.getenv("ENABLE_GITHUB_TRACKER", "false").lower() == "true":
+    if enable_github:
         try:
             import requests
         except ImportError:
@@ -78,8 +79,28 @@ def main():
     print("Loading configuration...")
     load_dotenv()
 
+    # Read the tracker configuration once, before anything starts
+    env = os.environ
+
+    def env_flag(name, default="false"):
+        """Read a true/false environment variable."""
+        return env.get(name, default).lower() == "true"
+
+    enable_activity = env_flag("ENABLE_ACTIVITY_TRACKER")
+    inactivity_limit = env.get("ACTIVITY_TRACKER_INACTIVITY_LIMIT", "300")
+    check_interval = env.get("ACTIVITY_TRACKER_CHECK_INTERVAL", "5")
+
+    enable_github = env_flag("ENABLE_GITHUB_TRACKER")
+    tracker_mode = env.get("COMMIT_TRACKER_MODE", "user").lower()
+    github_username = env.get("COMMIT_TRACKER_USERNAME")
+    github_org = env.get("COMMIT_TRACKER_ORG")
+    github_token = env.get("COMMIT_TRACKER_TOKEN")
+    use_worked_hours = env_flag("COMMIT_TRACKER_USE_WORKED_HOURS", "true")
+    timezone = env.get("COMMIT_TRACKER_TIMEZONE", "America/Asuncion")
+    poll_interval = env.get("COMMIT_TRACKER_POLL_INTERVAL", "60")
+
     # Check requirements
-    issues = check_requirements()
+    issues = check_requirements(enable_activity, enable_github)
     if issues:
         print("\n⚠ Configuration Issues:")
         for issue in issues:
@@ -117,29 +138,26 @@ def main():
     trackers = []
 
     # Activity Tracker
-    if os.getenv("ENABLE_ACTIVITY_TRACKER", "false").lower() == "true":
+    if enable_activity:
         try:
             print("\nInitializing Activity Tracker...")
+            inactivity_limit = int(inactivity_limit)
             activity_tracker = ActivityTrackerService(
                 clockify_client=clockify_client,
                 settings=settings,
-                inactivity_limit=int(os.getenv("ACTIVITY_TRACKER_INACTIVITY_LIMIT", "300")),
-                check_interval=int(os.getenv("ACTIVITY_TRACKER_CHECK_INTERVAL", "5"))
+                inactivity_limit=inactivity_limit,
+                check_interval=int(check_interval)
             )
             activity_tracker.start_monitoring()
             trackers.append(("Activity Tracker", activity_tracker))
-            print(f"✓ Activity Tracker started (inactivity limit: {os.getenv('ACTIVITY_TRACKER_INACTIVITY_LIMIT', '300')}s)")
+            print(f"✓ Activity Tracker started (inactivity limit: {inactivity_limit}s)")
         except Exception as e:
             print(f"❌ Failed to start Activity Tracker: {e}")
     else:
         print("\n⊘ Activity Tracker disabled (set ENABLE_ACTIVITY_TRACKER=true to enable)")
 
     # GitHub Commit Tracker
-    if os.getenv("ENABLE_GITHUB_TRACKER", "false").lower() == "true":
-        tracker_mode = os.getenv("COMMIT_TRACKER_MODE", "user").lower()
-        github_username = os.getenv("COMMIT_TRACKER_USERNAME")
-        github_org = os.getenv("COMMIT_TRACKER_ORG")
-
+    if enable_github:
         # Validate configuration based on mode
         if tracker_mode == "org" and not github_org:
             print("\n⚠ COMMIT_TRACKER_ORG not configured for org mode, skipping GitHub tracker")
@@ -149,24 +167,20 @@ def main():
             try:
                 print(f"\nInitializing GitHub Commit Tracker (mode: {tracker_mode})...")
 
-                # Get worked hours configuration
-                use_worked_hours = os.getenv("COMMIT_TRACKER_USE_WORKED_HOURS", "true").lower() == "true"
-                timezone = os.getenv("COMMIT_TRACKER_TIMEZONE", "America/Asuncion")
-
                 github_tracker = GitHubCommitTrackerService(
                     clockify_client=clockify_client,
                     settings=settings,
                     github_username=github_username if tracker_mode == "user" else None,
                     github_org=github_org if tracker_mode == "org" else None,
-                    github_token=os.getenv("COMMIT_TRACKER_TOKEN"),
-                    poll_interval=int(os.getenv("COMMIT_TRACKER_POLL_INTERVAL", "60")),
+                    github_token=github_token,
+                    poll_interval=int(poll_interval),
                     timezone=timezone,
                     use_worked_hours=use_worked_hours
                 )
                 github_tracker.start_tracking()
                 trackers.append(("GitHub Tracker", github_tracker))
 
-                token_status = "with token" if os.getenv("COMMIT_TRACKER_TOKEN") else "without token"
+                token_status = "with token" if github_token else "without token"
                 target = github_org if tracker_mode == "org" else github_username
                 mode_desc = "cluster-based hours" if use_worked_hours else "individual commits"
                 print(f"✓ GitHub Tracker started for {tracker_mode} '{target}' ({token_status}, {mode_desc})")
@@ -201,28 +215,34 @@ def main():
     print("\nPress Ctrl+C to stop all trackers")
     print("="*60 + "\n")
 
-    # Keep running
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("\n\nShutting down...")
-        print("="*60)
-
-        # Stop all trackers
-        for name, tracker in trackers:
-            try:
-                if hasattr(tracker, 'stop_monitoring'):
-                    tracker.stop_monitoring()
-                elif hasattr(tracker, 'stop_tracking'):
-                    tracker.stop_tracking()
-                print(f"✓ {name} stopped")
-            except Exception as e:
-                print(f"⚠ Error stopping {name}: {e}")
+    # Block until Ctrl+C or a termination signal instead of polling
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
 
-        print("="*60)
-        print("All trackers stopped. Goodbye!")
-        return 0
+    # Windows cannot interrupt a blocking wait with a signal, so wake up
+    # once a second there to let the handler run
+    wait_timeout = 1 if sys.platform == "win32" else None
+    while not stop_event.wait(wait_timeout):
+        pass
+
+    print("\n\nShutting down...")
+    print("="*60)
+
+    # Stop all trackers
+    for name, tracker in trackers:
+        try:
+            if hasattr(tracker, 'stop_monitoring'):
+                tracker.stop_monitoring()
+            elif hasattr(tracker, 'stop_tracking'):
+                tracker.stop_tracking()
+            print(f"✓ {name} stopped")
+        except Exception as e:
+            print(f"⚠ Error stopping {name}: {e}")
+
+    print("="*60)
+    print("All trackers stopped. Goodbye!")
+    return 0
 
 
 if __name__ == "__main__":